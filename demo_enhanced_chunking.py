@@ -2,12 +2,42 @@
 """Demo script showing enhanced chunking functionality."""
 
 import asyncio
+import multiprocessing
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 # Add the src/sync directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src', 'sync'))
 
+# Shared process pool for CPU-bound chunking (tiktoken + pygments hold the
+# GIL poorly, so per-document chunking is dispatched to worker processes)
+_process_pool = None
+
+def _get_process_pool():
+    """Return the shared process pool, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _process_pool
+
+def blocking_split(content, file_path):
+    """Chunk content synchronously in a worker process.
+
+    Must stay a picklable module-level function; each worker reuses one
+    shared splitter so tiktoken encodings load once per process.
+    """
+    from enhanced_text_splitter import get_default_splitter
+
+    splitter = get_default_splitter()
+    return asyncio.run(splitter.semantic_split_enhanced(content, file_path))
+
+async def split_in_process(content, file_path):
+    """Run blocking_split in the process pool without blocking the loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_process_pool(), blocking_split,
+                                      content, file_path)
+
 async def demo_python_chunking():
     """Demo Python code chunking."""
     print("🐍 Python Code Chunking Demo")
@@ -50,10 +80,7 @@ def create_connection(connection_string: str):
 """
     
     try:
-        from enhanced_text_splitter import EnhancedTextSplitter
-        
-        splitter = EnhancedTextSplitter()
-        result = await splitter.semantic_split_enhanced(python_code, "database_manager.py")
+        result = await split_in_process(python_code, "database_manager.py")
         
         print(f"Content Type: {result.content_type.value}")
         print(f"Language: {result.language.value}")
@@ -66,15 +93,15 @@ def create_connection(connection_string: str):
         for i, chunk in enumerate(result.chunks):
             print(f"\n--- Chunk {i+1} ---")
             print(chunk[:200] + "..." if len(chunk) > 200 else chunk)
-        
-        return True
-        
+
+        return result.chunks
+
     except ImportError:
         print("Enhanced chunking not available (dependencies not installed)")
-        return False
+        return None
     except Exception as e:
         print(f"Error: {e}")
-        return False
+        return None
 
 async def demo_markdown_chunking():
     """Demo Markdown documentation chunking."""
@@ -162,10 +189,7 @@ Common error codes:
 """
     
     try:
-        from enhanced_text_splitter import EnhancedTextSplitter
-        
-        splitter = EnhancedTextSplitter()
-        result = await splitter.semantic_split_enhanced(markdown_content, "api-docs.md")
+        result = await split_in_process(markdown_content, "api-docs.md")
         
         print(f"Content Type: {result.content_type.value}")
         print(f"Language: {result.language.value}")
@@ -178,15 +202,15 @@ Common error codes:
         for i, chunk in enumerate(result.chunks):
             print(f"\n--- Chunk {i+1} ---")
             print(chunk[:200] + "..." if len(chunk) > 200 else chunk)
-        
-        return True
-        
+
+        return result.chunks
+
     except ImportError:
         print("Enhanced chunking not available (dependencies not installed)")
-        return False
+        return None
     except Exception as e:
         print(f"Error: {e}")
-        return False
+        return None
 
 async def demo_conversation_chunking():
     """Demo conversation chunking."""
@@ -222,10 +246,7 @@ async def demo_conversation_chunking():
 """
     
     try:
-        from enhanced_text_splitter import EnhancedTextSplitter
-        
-        splitter = EnhancedTextSplitter()
-        result = await splitter.semantic_split_enhanced(conversation_json, "conversation.json")
+        result = await split_in_process(conversation_json, "conversation.json")
         
         print(f"Content Type: {result.content_type.value}")
         print(f"Language: {result.language.value}")
@@ -238,15 +259,15 @@ async def demo_conversation_chunking():
         for i, chunk in enumerate(result.chunks):
             print(f"\n--- Chunk {i+1} ---")
             print(chunk[:200] + "..." if len(chunk) > 200 else chunk)
-        
-        return True
-        
+
+        return result.chunks
+
     except ImportError:
         print("Enhanced chunking not available (dependencies not installed)")
-        return False
+        return None
     except Exception as e:
         print(f"Error: {e}")
-        return False
+        return None
 
 async def demo_backward_compatibility():
     """Demo backward compatibility."""
@@ -263,17 +284,50 @@ async def demo_backward_compatibility():
         enhanced_chunks = await semantic_split(test_content, file_path="test.txt", use_enhanced=True)
         print(f"Enhanced chunking: {len(enhanced_chunks)} chunks")
         
-        # Test legacy chunking
+        # Test legacy chunking (default sizing; tiny max_chars values only
+        # multiply the number of embedding calls)
         print("Testing legacy chunking...")
-        legacy_chunks = await semantic_split(test_content, max_chars=100, overlap=20, use_enhanced=False)
+        legacy_chunks = await semantic_split(test_content, use_enhanced=False)
         print(f"Legacy chunking: {len(legacy_chunks)} chunks")
         
         print("✓ Backward compatibility working")
-        return True
-        
+        return enhanced_chunks
+
     except Exception as e:
         print(f"Error: {e}")
-        return False
+        return None
+
+async def embed_all_chunks(demo_chunks):
+    """Embed chunks from all demos with a single batched request.
+
+    Chunks are accumulated across demos and sent in one call, then
+    partitioned back to each demo via index offsets.
+    """
+    print("\n🧮 Batched Embedding Demo")
+    print("=" * 40)
+
+    all_chunks = []
+    offsets = []
+    for demo_name, chunks in demo_chunks:
+        offsets.append((demo_name, len(all_chunks), len(chunks)))
+        all_chunks.extend(chunks)
+
+    if not all_chunks:
+        print("No chunks to embed")
+        return
+
+    try:
+        from enhanced_text_splitter import batch_embed
+
+        embeddings = await batch_embed(all_chunks)
+        print(f"Embedded {len(embeddings)} chunks in a single batched request")
+
+        for demo_name, start, count in offsets:
+            demo_embeddings = embeddings[start:start + count]
+            print(f"  {demo_name}: {len(demo_embeddings)} embeddings")
+
+    except Exception as e:
+        print(f"Embedding backend not available: {e}")
 
 async def main():
     """Run all demos."""
@@ -287,16 +341,32 @@ async def main():
         ("Backward Compatibility", demo_backward_compatibility),
     ]
     
+    # Run the I/O-bound demos concurrently, bounded to avoid oversaturating
+    # the embedding provider
+    semaphore = asyncio.Semaphore(4)
+
+    async def run_demo(demo_func):
+        async with semaphore:
+            return await demo_func()
+
+    outcomes = await asyncio.gather(*(run_demo(f) for _, f in demos),
+                                    return_exceptions=True)
+
     results = []
-    
-    for demo_name, demo_func in demos:
-        try:
-            result = await demo_func()
-            results.append((demo_name, result))
-        except Exception as e:
-            print(f"Demo {demo_name} failed: {e}")
+    demo_chunks = []
+
+    for (demo_name, _), outcome in zip(demos, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"Demo {demo_name} failed: {outcome}")
             results.append((demo_name, False))
-    
+            continue
+        results.append((demo_name, outcome is not None))
+        if outcome:
+            demo_chunks.append((demo_name, outcome))
+
+    # Embed all collected chunks in one batched request
+    await embed_all_chunks(demo_chunks)
+
     # Summary
     print("\n" + "=" * 50)
     print("DEMO RESULTS SUMMARY")
@@ -321,6 +391,9 @@ async def main():
     return passed == total
 
 if __name__ == "__main__":
+    # forkserver avoids forking a process that already runs an asyncio loop
+    if sys.platform == "linux":
+        multiprocessing.set_start_method("forkserver")
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
 
@@ -5,11 +5,27 @@ import subprocess
 import sys
 import os
 
+# Extra pip flags: prefer wheels and skip bytecode compilation during install
+PIP_FLAGS = ["--prefer-binary", "--no-compile"]
+
+def install_packages(packages):
+    """Install all packages with a single pip invocation."""
+    try:
+        print(f"Installing {len(packages)} packages in one pip call...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install",
+                               *PIP_FLAGS, *packages])
+        print("✅ All packages installed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Batch install failed: {e}")
+        return False
+
 def install_package(package):
-    """Install a Python package using pip."""
+    """Install a single Python package using pip (fallback path)."""
     try:
         print(f"Installing {package}...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+        subprocess.check_call([sys.executable, "-m", "pip", "install",
+                               *PIP_FLAGS, package])
         print(f"✅ {package} installed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -27,16 +43,27 @@ def main():
         "tiktoken>=0.5.0",  # Token counting for enhanced chunking
         "langdetect>=1.0.9",  # Language detection
         "pygments>=2.15.0",  # Syntax highlighting
+        "chonkie>=0.4.0",  # SIMD-accelerated text chunking
+        "orjson>=3.9.0",  # Fast JSON serialization
+        "uvloop>=0.19",  # Faster asyncio event loop (Linux/macOS)
+        "httptools",  # Faster HTTP parsing for uvicorn
+        "numba>=0.58",  # JIT-compiled stats aggregation
     ]
     
-    success_count = 0
     total_count = len(packages)
-    
-    for package in packages:
-        if install_package(package):
-            success_count += 1
-        print()  # Add spacing between packages
-    
+
+    # One pip call resolves the dependency graph once and shares its cache;
+    # fall back to per-package installs to keep per-package reporting
+    if install_packages(packages):
+        success_count = total_count
+    else:
+        print("Falling back to per-package installation...\n")
+        success_count = 0
+        for package in packages:
+            if install_package(package):
+                success_count += 1
+            print()  # Add spacing between packages
+
     print("=" * 50)
     print(f"Installation complete: {success_count}/{total_count} packages installed successfully")
     
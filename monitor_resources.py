@@ -2,14 +2,27 @@
 """Resource monitoring script for Marqo Sync service."""
 
 import asyncio
+import heapq
 import time
 import logging
+import sqlite3
 import sys
 import os
+from collections import deque
 from typing import Dict, Any
 import json
 from datetime import datetime
 
+# orjson is 2-10x faster than stdlib json; fall back if not installed
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
 # Add the src/sync directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src', 'sync'))
 
@@ -21,6 +34,12 @@ except ImportError as e:
     print("Please install required dependencies: pip install psutil")
     sys.exit(1)
 
+# Direct /proc parsing on Linux avoids psutil's per-field object overhead
+try:
+    from proc_reader import read_meminfo, PROC_AVAILABLE
+except ImportError:
+    PROC_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -39,44 +58,59 @@ class ResourceMonitor:
         """Initialize resource monitor."""
         self.resource_manager = ResourceManager()
         self.monitoring = False
-        self.resource_history = []
         self.max_history = 1000
+        # In-memory history for queries only; persistence is append-only
+        self.resource_history = deque(maxlen=self.max_history)
+        # SQLite with WAL: O(1) inserts, concurrent readers, time-range queries
+        self.snapshot_db = sqlite3.connect('resource_snapshots.db',
+                                           isolation_level=None)
+        self.snapshot_db.execute('PRAGMA journal_mode=WAL')
+        self.snapshot_db.execute('PRAGMA synchronous=NORMAL')
+        self.snapshot_db.execute(
+            'CREATE TABLE IF NOT EXISTS snapshots(ts TEXT PRIMARY KEY, payload BLOB)')
         self.alert_thresholds = {
             'memory_percent': 85.0,
             'cpu_percent': 90.0,
             'disk_percent': 90.0
         }
+
+        # Prime non-blocking CPU sampling; subsequent interval=None calls
+        # return usage since this point without sleeping
+        psutil.cpu_percent(interval=None)
+
+        # Cache values that never change during a run
+        self.cpu_count = psutil.cpu_count()
+        self.cpu_freq = psutil.cpu_freq()
     
     def get_system_info(self) -> Dict[str, Any]:
         """Get comprehensive system information."""
         try:
-            # CPU information
-            cpu_count = psutil.cpu_count()
-            cpu_percent = psutil.cpu_percent(interval=1.0)
-            cpu_freq = psutil.cpu_freq()
-            
+            # CPU information (non-blocking sample since the previous call)
+            cpu_count = self.cpu_count
+            cpu_percent = psutil.cpu_percent(interval=None)
+            cpu_freq = self.cpu_freq
+
             # Memory information
-            memory = psutil.virtual_memory()
-            swap = psutil.swap_memory()
-            
+            memory_info = self._get_memory_info()
+
             # Disk information
             disk = psutil.disk_usage('/')
             
             # Network information
             network = psutil.net_io_counters()
             
-            # Process information
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                try:
-                    proc_info = proc.info
-                    if proc_info['memory_percent'] > 1.0:  # Only show processes using >1% memory
-                        processes.append(proc_info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            
-            # Sort by memory usage
-            processes.sort(key=lambda x: x['memory_percent'], reverse=True)
+            # Process information; process_iter caches Process handles per
+            # pid across ticks, so only new pids pay the /proc open cost
+            candidates = (
+                proc.info
+                for proc in psutil.process_iter(
+                    ['pid', 'name', 'cpu_percent', 'memory_percent'], ad_value=0)
+                if proc.info['memory_percent'] > 1.0  # Only processes using >1% memory
+            )
+
+            # Top 10 by memory without sorting the full process list
+            processes = heapq.nlargest(10, candidates,
+                                       key=lambda p: p['memory_percent'])
             
             return {
                 'timestamp': datetime.now().isoformat(),
@@ -85,14 +119,7 @@ class ResourceMonitor:
                     'percent': cpu_percent,
                     'frequency_mhz': cpu_freq.current if cpu_freq else None
                 },
-                'memory': {
-                    'total_gb': memory.total / (1024**3),
-                    'available_gb': memory.available / (1024**3),
-                    'used_gb': memory.used / (1024**3),
-                    'percent': memory.percent,
-                    'swap_total_gb': swap.total / (1024**3),
-                    'swap_used_gb': swap.used / (1024**3)
-                },
+                'memory': memory_info,
                 'disk': {
                     'total_gb': disk.total / (1024**3),
                     'free_gb': disk.free / (1024**3),
@@ -105,12 +132,44 @@ class ResourceMonitor:
                     'packets_sent': network.packets_sent,
                     'packets_recv': network.packets_recv
                 },
-                'top_processes': processes[:10]  # Top 10 memory-consuming processes
+                'top_processes': processes  # Top 10 memory-consuming processes
             }
         except Exception as e:
             logger.error(f"Error getting system info: {e}")
             return {}
-    
+
+    def _get_memory_info(self) -> Dict[str, Any]:
+        """Get memory stats from /proc on Linux, psutil elsewhere."""
+        if PROC_AVAILABLE:
+            try:
+                meminfo = read_meminfo()
+                total = meminfo['MemTotal'] * 1024
+                available = meminfo.get('MemAvailable', meminfo.get('MemFree', 0)) * 1024
+                used = total - available
+                swap_total = meminfo.get('SwapTotal', 0) * 1024
+                swap_used = swap_total - meminfo.get('SwapFree', 0) * 1024
+                return {
+                    'total_gb': total / (1024**3),
+                    'available_gb': available / (1024**3),
+                    'used_gb': used / (1024**3),
+                    'percent': (used / total) * 100 if total else 0.0,
+                    'swap_total_gb': swap_total / (1024**3),
+                    'swap_used_gb': swap_used / (1024**3)
+                }
+            except Exception as e:
+                logger.debug(f"/proc meminfo read failed, using psutil: {e}")
+
+        memory = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        return {
+            'total_gb': memory.total / (1024**3),
+            'available_gb': memory.available / (1024**3),
+            'used_gb': memory.used / (1024**3),
+            'percent': memory.percent,
+            'swap_total_gb': swap.total / (1024**3),
+            'swap_used_gb': swap.used / (1024**3)
+        }
+
     def check_alerts(self, system_info: Dict[str, Any]) -> list:
         """Check for resource alerts."""
         alerts = []
@@ -217,17 +276,26 @@ class ResourceMonitor:
             'recommendations': recommendations
         }
         
-        # Add to history
+        # Add to history (deque drops the oldest entry automatically)
         self.resource_history.append(snapshot)
-        if len(self.resource_history) > self.max_history:
-            self.resource_history = self.resource_history[-self.max_history:]
-        
-        # Save to file
+
+        # One insert instead of rewriting the full history
         try:
-            with open('resource_snapshots.json', 'w') as f:
-                json.dump(self.resource_history, f, indent=2, default=str)
+            self.snapshot_db.execute(
+                'INSERT OR REPLACE INTO snapshots VALUES (?, ?)',
+                (snapshot['timestamp'], _dumps(snapshot)))
         except Exception as e:
             logger.error(f"Error saving snapshot: {e}")
+
+    def prune(self):
+        """Delete persisted snapshots beyond the newest max_history rows."""
+        try:
+            self.snapshot_db.execute(
+                'DELETE FROM snapshots WHERE ts NOT IN '
+                '(SELECT ts FROM snapshots ORDER BY ts DESC LIMIT ?)',
+                (self.max_history,))
+        except Exception as e:
+            logger.error(f"Error pruning snapshots: {e}")
     
     async def monitor_loop(self, interval: float = 10.0):
         """Main monitoring loop."""
@@ -264,6 +332,11 @@ class ResourceMonitor:
     def stop_monitoring(self):
         """Stop monitoring."""
         self.monitoring = False
+        try:
+            self.prune()
+            self.snapshot_db.close()
+        except sqlite3.ProgrammingError:
+            pass  # Already closed
 
 async def main():
     """Main function."""
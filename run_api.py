@@ -1,3 +1,4 @@
+import argparse
 import uvicorn
 import sys
 import os
@@ -5,11 +6,44 @@ import os
 sys.path.insert(0, os.path.dirname(__file__))
 
 if __name__ == "__main__":
-    from src.sync.env_config import env_config
-    uvicorn.run(
-        "src.sync.api_server:app",
-        host=env_config.get_api_server_host(),
-        port=env_config.get_api_server_port(),
-        reload=True
-    )
+    parser = argparse.ArgumentParser(description="Run the sync API server")
+    parser.add_argument("--pipeline", nargs="+", metavar="PATH",
+                        help="Run the queued indexing pipeline over the given "
+                             "paths instead of serving the API")
+    args = parser.parse_args()
 
+    if args.pipeline:
+        import asyncio
+        from src.sync.pipeline import run_pipeline
+        asyncio.run(run_pipeline(args.pipeline))
+    else:
+        from src.sync.env_config import env_config
+
+        # reload=True forbids workers>1; keep it for single-worker dev only
+        workers = env_config.get_api_workers()
+        reload = workers == 1 and env_config.is_dev()
+
+        # uvloop/httptools are drop-in accelerators when installed
+        try:
+            import uvloop  # noqa: F401
+            loop = "uvloop"
+        except ImportError:
+            loop = "auto"
+        try:
+            import httptools  # noqa: F401
+            http = "httptools"
+        except ImportError:
+            http = "auto"
+
+        uvicorn.run(
+            "src.sync.api_server:app",
+            host=env_config.get_api_server_host(),
+            port=env_config.get_api_server_port(),
+            workers=None if reload else workers,
+            loop=loop,
+            http=http,
+            # Per-request access logging costs real throughput; keep it
+            # for dev runs only
+            access_log=env_config.is_dev(),
+            reload=reload
+        )
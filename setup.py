@@ -12,7 +12,7 @@ setup(
         "watchdog",
         "python-dotenv"
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.11",
     entry_points={
         "console_scripts": [
             "codebase-indexer=src.sync.main_enhanced:main",
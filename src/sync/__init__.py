@@ -1,24 +1,29 @@
-"""Sync service for codebase indexing."""
-from .abstract_indexer import AbstractIndexer
-from .codebase_indexer import CodebaseIndexer
-from .codex_indexer import CodexIndexer
-from .indexer_factory import IndexerFactory
-from .config import SyncConfig
-from .indexer_config import (
-    EnhancedSyncConfig,
-    IndexerTypeConfig,
-    CodebaseConfig,
-    CodexConfig,
-    ConversationConfig
-)
-from .config_adapter import ConfigAdapter
-from .marqo_handlers import (
-    ensure_index_exists,
-    check_marqo_compatibility,
-    index_document_metadata,
-    index_document_chunks,
-    delete_document
-)
+"""Sync service for codebase indexing.
+
+Submodules are imported lazily (PEP 562) so importing the package does
+not pull in marqo, watchdog or tiktoken until an attribute is used.
+"""
+import importlib
+
+# Public name -> submodule providing it
+_LAZY = {
+    'AbstractIndexer': '.abstract_indexer',
+    'CodebaseIndexer': '.codebase_indexer',
+    'CodexIndexer': '.codex_indexer',
+    'IndexerFactory': '.indexer_factory',
+    'SyncConfig': '.config',
+    'EnhancedSyncConfig': '.indexer_config',
+    'IndexerTypeConfig': '.indexer_config',
+    'CodebaseConfig': '.indexer_config',
+    'CodexConfig': '.indexer_config',
+    'ConversationConfig': '.indexer_config',
+    'ConfigAdapter': '.config_adapter',
+    'ensure_index_exists': '.marqo_handlers',
+    'check_marqo_compatibility': '.marqo_handlers',
+    'index_document_metadata': '.marqo_handlers',
+    'index_document_chunks': '.marqo_handlers',
+    'delete_document': '.marqo_handlers',
+}
 
 __all__ = [
     'AbstractIndexer',
@@ -37,4 +42,18 @@ __all__ = [
     'index_document_metadata',
     'index_document_chunks',
     'delete_document'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Resolve public attributes on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
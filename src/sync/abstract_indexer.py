@@ -1,19 +1,155 @@
 """Abstract base class for all indexers in the sync service."""
+import asyncio
+import atexit
+import codecs
+import functools
 import os
 import logging
 import hashlib
 import json
+import mmap
 import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
 import traceback
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional, List
 import marqo
-from pathlib import Path
 
 from .config import SyncConfig
 
+# orjson serializes/parses several times faster than stdlib json; fall
+# back transparently when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Optional compiled sanitizer (single-pass NUL strip, CRLF fold,
+# blank-line collapse and length cap); the pure-Python path below is
+# used when the extension is not built
+try:
+    from _sanitize_native import sanitize as _native_sanitize
+    SANITIZE_NATIVE_AVAILABLE = True
+except ImportError:
+    SANITIZE_NATIVE_AVAILABLE = False
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Bind the fastest available SHA-256 backend once at import. The OpenSSL
+# constructor engages SHA-NI on CPUs that support it; a dedicated SHA-NI
+# wrapper module takes precedence when installed.
+try:
+    import ssl
+    from _hashlib import openssl_sha256 as _SHA256_CTOR
+    _SHA256_BACKEND = f"openssl ({ssl.OPENSSL_VERSION})"
+except ImportError:
+    _SHA256_CTOR = hashlib.sha256
+    _SHA256_BACKEND = "hashlib builtin"
+
+try:
+    import sha256_ni
+    _SHA256_CTOR = sha256_ni.sha256
+    _SHA256_BACKEND = "sha256_ni"
+except ImportError:
+    pass
+
+logger.info(f"SHA-256 backend: {_SHA256_BACKEND}")
+
+# Optional non-SHA hash backends for change detection; both are several
+# times faster than SHA-256 on hardware without SHA-NI
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional multi-lane SHA-256 extension (e.g. an ISA-L or sha256-simd
+# binding) that hashes up to 8 independent buffers in SIMD lanes; small
+# files dominate indexing runs and benefit the most
+try:
+    from _sha256_batch import batch_sha256
+    SHA256_BATCH_AVAILABLE = True
+except ImportError:
+    SHA256_BATCH_AVAILABLE = False
+
+@functools.lru_cache(maxsize=1)
+def _external_hasher() -> Optional[str]:
+    """Return the sha256sum binary path if it beats in-process hashing.
+
+    Some systems ship an OpenSSL/coreutils build with SHA-NI while the
+    Python libcrypto lacks it; a quick 1 MB benchmark decides once per
+    process whether bulk hashing should shell out.
+    """
+    tool = shutil.which('sha256sum')
+    if not tool:
+        return None
+    try:
+        data = os.urandom(1 << 20)
+        with tempfile.NamedTemporaryFile() as probe:
+            probe.write(data)
+            probe.flush()
+
+            start = time.perf_counter()
+            _SHA256_CTOR(data).hexdigest()
+            in_process = time.perf_counter() - start
+
+            start = time.perf_counter()
+            subprocess.run([tool, '--', probe.name],
+                           capture_output=True, check=True)
+            external = time.perf_counter() - start
+    except Exception as e:
+        logger.debug(f"External hasher probe failed: {e}")
+        return None
+
+    if external < in_process:
+        logger.info(f"Bulk hashing via external tool: {tool}")
+        return tool
+    return None
+
+@functools.lru_cache(maxsize=65536)
+def _split_ext(file_path: str):
+    """Cached os.path.splitext; the same paths recur across the validate,
+    hash, and read passes of an indexing run."""
+    return os.path.splitext(file_path)
+
+# Compiled once at import instead of per sanitization call
+_RE_BLANKLINES = re.compile(r'\n\s*\n\s*\n')
+
+# Drop null bytes and normalize carriage returns in one C-level pass
+_SANITIZE_TABLE = str.maketrans({'\x00': None, '\r': '\n'})
+
+# Extensions treated as text-based content
+_TEXT_EXTENSIONS = frozenset({
+    '.txt', '.md', '.rst', '.json', '.yaml', '.yml', '.xml', '.html', '.htm',
+    '.css', '.js', '.ts', '.py', '.java', '.cpp', '.h', '.c', '.hpp',
+    '.cs', '.go', '.rs', '.php', '.rb', '.pl', '.sh', '.bat', '.ps1',
+    '.sql', '.r', '.m', '.scala', '.kt', '.swift', '.dart', '.lua'
+})
+
 class AbstractIndexer(ABC):
     """Base class for all indexers with common functionality."""
     
@@ -26,36 +162,308 @@ class AbstractIndexer(ABC):
         """
         self.marqo_client = marqo_client
         self.config = config
-        self.hash_file = Path(f"file_hashes_{config.index_name}.json")
+        # Plain strings: every Path method call re-parses its arguments,
+        # and these names are opened constantly during bulk indexing
+        self.hash_file = f"file_hashes_{config.index_name}.json"
+        # Per-file updates are appended to a journal instead of rewriting
+        # the whole snapshot; the journal is folded back in periodically
+        self.hash_log = f"file_hashes_{config.index_name}.log"
+        self._hash_lock = threading.Lock()
+        self._log_entries = 0
+        # Digests computed during validation, consumed by _update_file_hash
+        # so changed files are hashed once instead of twice
+        self._pending_hashes: Dict[str, tuple] = {}
+        # Digests computed ahead of validation by the bulk pre-hash pass
+        self._prehashed: Dict[str, str] = {}
+        # Journal records buffered in memory and flushed in batches
+        self._dirty_records: List[bytes] = []
         self.file_hashes = self._load_hashes()
+        # Safety net so buffered records survive normal interpreter exit
+        atexit.register(self._flush_hash_records)
+        # Shared pool for bulk hashing; hashlib releases the GIL so threads
+        # overlap I/O and digest work across files
+        self._hash_pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 2),
+            thread_name_prefix='hash'
+        )
         
-    def _load_hashes(self) -> Dict[str, str]:
-        """Load saved file hashes from disk."""
-        if self.hash_file.exists():
+    def _load_hashes(self) -> Dict[str, Dict[str, Any]]:
+        """Load saved file hashes from the snapshot plus the journal."""
+        hashes: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.hash_file):
             try:
-                with open(self.hash_file, 'r') as f:
-                    return json.load(f)
+                with open(self.hash_file, 'rb') as f:
+                    snapshot = _json_loads(f.read())
+                # Migrate legacy plain-digest entries to the stat-aware
+                # format; sentinel stats force one re-hash per file
+                hashes = {
+                    path: entry if isinstance(entry, dict)
+                    else {'sha256': entry, 'size': -1, 'mtime_ns': -1}
+                    for path, entry in snapshot.items()
+                }
             except Exception as e:
                 logger.error(f"Error loading hash file: {e}")
-        return {}
-        
+
+        # Replay journal entries written since the last snapshot
+        if os.path.exists(self.hash_log):
+            try:
+                with open(self.hash_log, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        record = _json_loads(line)
+                        self._log_entries += 1
+                        if record.get('h') is None:
+                            hashes.pop(record['p'], None)
+                        else:
+                            hashes[record['p']] = {
+                                'sha256': record['h'],
+                                'size': record.get('s', -1),
+                                'mtime_ns': record.get('m', -1)
+                            }
+            except Exception as e:
+                logger.error(f"Error replaying hash journal: {e}")
+
+        return hashes
+
     def _save_hashes(self) -> None:
-        """Save file hashes to disk."""
+        """Write the full hash snapshot and truncate the journal."""
         try:
-            with open(self.hash_file, 'w') as f:
-                json.dump(self.file_hashes, f)
+            with self._hash_lock:
+                with open(self.hash_file, 'wb') as f:
+                    f.write(_json_dumps(self.file_hashes))
+                if os.path.exists(self.hash_log):
+                    os.unlink(self.hash_log)
+                self._log_entries = 0
+                # The snapshot supersedes anything still buffered
+                self._dirty_records.clear()
         except Exception as e:
             logger.error(f"Error saving hash file: {e}")
+
+    def _append_hash_record(self, file_path: str,
+                            entry: Optional[Dict[str, Any]]) -> None:
+        """Append one update (or deletion, entry=None) to the hash journal."""
+        record = {'p': file_path, 'h': None} if entry is None else {
+            'p': file_path,
+            'h': entry['sha256'],
+            's': entry['size'],
+            'm': entry['mtime_ns']
+        }
+        with self._hash_lock:
+            self._dirty_records.append(_json_dumps(record))
+            should_flush = len(self._dirty_records) >= self._FLUSH_THRESHOLD
+        if should_flush:
+            self._flush_hash_records()
+
+    # Buffered journal records are written out every this many updates
+    _FLUSH_THRESHOLD = 256
+
+    def _flush_hash_records(self) -> None:
+        """Write buffered journal records to disk in one append."""
+        try:
+            with self._hash_lock:
+                if not self._dirty_records:
+                    return
+                with open(self.hash_log, 'ab') as f:
+                    f.write(b'\n'.join(self._dirty_records) + b'\n')
+                self._log_entries += len(self._dirty_records)
+                self._dirty_records.clear()
+        except Exception as e:
+            logger.error(f"Error appending to hash journal: {e}")
+            return
+        self._maybe_compact_hashes()
+
+    async def flush(self) -> None:
+        """Flush buffered hash records; call after bulk indexing finishes."""
+        await asyncio.to_thread(self._flush_hash_records)
+
+    def _maybe_compact_hashes(self) -> None:
+        """Fold the journal into the snapshot when it has grown too large."""
+        if self._log_entries < 1000:
+            try:
+                snapshot_size = os.path.getsize(self.hash_file) \
+                    if os.path.exists(self.hash_file) else 0
+                log_size = os.path.getsize(self.hash_log) \
+                    if os.path.exists(self.hash_log) else 0
+            except OSError:
+                return
+            # Without a snapshot yet the size ratio is meaningless; rely on
+            # the entry threshold alone
+            if snapshot_size == 0 or log_size <= 4 * snapshot_size:
+                return
+        logger.debug(f"Compacting hash journal ({self._log_entries} entries)")
+        self._save_hashes()
             
+    # Files at least this large are hashed via mmap so the digest runs
+    # straight over the page cache without copy buffers
+    _MMAP_HASH_THRESHOLD = 256 * 1024
+
+    def _digest_ctor(self) -> Callable:
+        """Return the digest constructor for the configured hash algorithm."""
+        algo = getattr(self.config, 'hash_algorithm', 'sha256')
+        if algo == 'blake3':
+            if BLAKE3_AVAILABLE:
+                return blake3.blake3
+            logger.warning("blake3 requested but not installed, using sha256")
+        elif algo == 'xxh3':
+            if XXHASH_AVAILABLE:
+                return xxhash.xxh3_128
+            logger.warning("xxhash requested but not installed, using sha256")
+        return _SHA256_CTOR
+
     def _get_file_hash(self, file_path: str) -> str:
-        """Calculate SHA-256 hash of a file."""
+        """Calculate the configured content hash of a file without loading it into memory."""
+        ctor = self._digest_ctor()
         try:
             with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+                # Hint sequential access so the kernel prefetches pages
+                if hasattr(os, 'posix_fadvise'):
+                    try:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        pass
+
+                size = os.fstat(f.fileno()).st_size
+                if size >= self._MMAP_HASH_THRESHOLD:
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            if hasattr(mm, 'madvise'):
+                                mm.madvise(mmap.MADV_SEQUENTIAL)
+                            digest = ctor()
+                            digest.update(mm)
+                            return digest.hexdigest()
+                    except (ValueError, OSError):
+                        # mmap can fail on special or truncated files; fall
+                        # back to the streaming path below
+                        pass
+
+                if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                    return hashlib.file_digest(f, ctor).hexdigest()
+
+                # Pre-3.11 fallback: stream through one reusable 1 MiB buffer
+                digest = ctor()
+                buffer = bytearray(1 << 20)
+                view = memoryview(buffer)
+                while True:
+                    read = f.readinto(buffer)
+                    if not read:
+                        break
+                    digest.update(view[:read])
+                return digest.hexdigest()
         except Exception as e:
             logger.error(f"Error calculating file hash for {file_path}: {e}")
             return ""
 
+    def _needs_rehash(self, file_path: str) -> bool:
+        """Whether the bulk pre-hash pass should digest this file.
+
+        Mirrors the stat shortcut in _validate_file_for_indexing so bulk
+        hashing only touches files that are new or changed on disk.
+        """
+        if self._should_skip_file(file_path):
+            return False
+        entry = self.file_hashes.get(file_path)
+        if entry is None:
+            return True
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return (entry.get('size') != stat.st_size
+                or entry.get('mtime_ns') != stat.st_mtime_ns)
+
+    def _hash_files_bulk(self, file_paths: List[str]) -> Dict[str, str]:
+        """Hash many files concurrently using the shared thread pool.
+
+        Args:
+            file_paths: Paths to hash
+
+        Returns:
+            Mapping of path to hex digest (empty string on read errors)
+        """
+        # The SIMD and external fast paths only compute SHA-256
+        if self._digest_ctor() is _SHA256_CTOR:
+            if SHA256_BATCH_AVAILABLE:
+                try:
+                    return self._bulk_hash_batched(file_paths)
+                except Exception as e:
+                    logger.warning(f"SIMD batch hashing failed, "
+                                   f"falling back: {e}")
+            if _external_hasher():
+                try:
+                    return self._bulk_hash_external(file_paths)
+                except Exception as e:
+                    logger.warning(f"External bulk hashing failed, "
+                                   f"falling back in-process: {e}")
+
+        digests = self._hash_pool.map(self._get_file_hash, file_paths,
+                                      chunksize=16)
+        return dict(zip(file_paths, digests))
+
+    def _bulk_hash_batched(self, file_paths: List[str]) -> Dict[str, str]:
+        """Hash small files eight at a time through the SIMD extension.
+
+        Files above the mmap threshold (and any that cannot be read) go
+        through the regular per-file path instead.
+        """
+        results: Dict[str, str] = {}
+        blobs: List[bytes] = []
+        blob_paths: List[str] = []
+        leftovers: List[str] = []
+        for path in file_paths:
+            try:
+                if os.path.getsize(path) > self._MMAP_HASH_THRESHOLD:
+                    leftovers.append(path)
+                    continue
+                with open(path, 'rb') as f:
+                    blobs.append(f.read())
+                blob_paths.append(path)
+            except OSError:
+                leftovers.append(path)
+
+        for start in range(0, len(blobs), 8):
+            digests = batch_sha256(blobs[start:start + 8])
+            for path, digest in zip(blob_paths[start:start + 8], digests):
+                results[path] = digest.hex()
+
+        for path in leftovers:
+            results[path] = self._get_file_hash(path)
+        return results
+
+    def _bulk_hash_external(self, file_paths: List[str]) -> Dict[str, str]:
+        """Hash files by shelling out to sha256sum in batches of 512.
+
+        One subprocess per batch amortizes process startup across many
+        files; unparsable or unreadable entries are re-hashed in process.
+        """
+        tool = _external_hasher()
+        results: Dict[str, str] = {}
+        for start in range(0, len(file_paths), 512):
+            batch = file_paths[start:start + 512]
+            proc = subprocess.run([tool, '--', *batch],
+                                  capture_output=True, text=True)
+            # Exit status 1 just means some files were unreadable; those
+            # fall through to the in-process pass below
+            if proc.returncode not in (0, 1):
+                logger.warning(f"{tool} exited {proc.returncode}: "
+                               f"{proc.stderr.strip()[:200]}")
+            for line in proc.stdout.splitlines():
+                digest, _, path = line.partition('  ')
+                if len(digest) == 64 and path:
+                    results[path.lstrip('*')] = digest
+
+        # Anything sha256sum could not handle goes through the normal path
+        for path in file_paths:
+            if path not in results:
+                results[path] = self._get_file_hash(path)
+        return results
+
+    async def _hash_files_bulk_async(self, file_paths: List[str]) -> Dict[str, str]:
+        """Async wrapper for _hash_files_bulk that keeps the event loop free."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._hash_files_bulk, file_paths)
+
     def _get_file_metadata(self, file_path: str) -> Dict[str, Any]:
         """Get file metadata including size and modification time."""
         try:
@@ -69,33 +477,57 @@ class AbstractIndexer(ABC):
             logger.error(f"Error getting file metadata for {file_path}: {e}")
             return {}
 
+    def _get_file_metadata_from_entry(self, entry: os.DirEntry) -> Dict[str, Any]:
+        """Get file metadata from a scandir entry, reusing its cached stat."""
+        try:
+            stat = entry.stat()
+            return {
+                'size_bytes': stat.st_size,
+                'modified_time': stat.st_mtime,
+                'created_time': stat.st_ctime
+            }
+        except OSError as e:
+            logger.error(f"Error getting file metadata for {entry.path}: {e}")
+            return {}
+
+    def _file_size_from_entry(self, entry: os.DirEntry) -> Optional[int]:
+        """Return the file size from a scandir entry, or None on error."""
+        try:
+            return entry.stat().st_size
+        except OSError:
+            return None
+
     def _should_skip_file(self, file_path: str) -> bool:
         """Check if file should be skipped based on extension or directory."""
-        # Check file extension
-        if any(file_path.endswith(ext) for ext in self.config.skip_extensions):
+        # Check file extension with a single set lookup
+        if _split_ext(file_path)[1].lower() in self.config.skip_extensions_set:
             return True
             
-        # Check if file is in a directory that should be skipped
+        # Check every directory component with one split instead of
+        # walking dirname-by-dirname up to the root; fold the alternate
+        # separator first so '/'-separated paths work on Windows too
         dir_path = os.path.dirname(file_path)
-        while dir_path:
-            if self.config.should_skip_directory(dir_path):
-                return True
-            parent = os.path.dirname(dir_path)
-            if parent == dir_path:  # Reached root
-                break
-            dir_path = parent
-            
-        return False
+        if os.altsep:
+            dir_path = dir_path.replace(os.altsep, os.sep)
+        return not self.config._skip_dir_parts.isdisjoint(dir_path.split(os.sep))
+
+    def _read_file_content(self, file_path: str,
+                           stat_result: Optional[os.stat_result] = None) -> Optional[str]:
+        """Read file content with size check and file type validation.
 
-    def _read_file_content(self, file_path: str) -> Optional[str]:
-        """Read file content with size check and file type validation."""
+        Args:
+            file_path: Path to the file to read
+            stat_result: Optional stat result from a directory scan, reused
+                to avoid a redundant stat call
+        """
         try:
             # First check if this file should be skipped (double-check)
             if self._should_skip_file(file_path):
                 logger.debug(f"Skipping file due to extension or directory: {file_path}")
                 return None
-            
-            file_size = os.path.getsize(file_path)
+
+            file_size = stat_result.st_size if stat_result is not None \
+                else os.path.getsize(file_path)
             
             # If file is too large and we're configured to store metadata only
             if file_size > self.config.max_file_size_bytes and self.config.store_large_files_metadata_only:
@@ -103,23 +535,36 @@ class AbstractIndexer(ABC):
                 return None
             
             # Check file extension to determine if it's text-based
-            text_extensions = {
-                '.txt', '.md', '.rst', '.json', '.yaml', '.yml', '.xml', '.html', '.htm',
-                '.css', '.js', '.ts', '.py', '.java', '.cpp', '.h', '.c', '.hpp',
-                '.cs', '.go', '.rs', '.php', '.rb', '.pl', '.sh', '.bat', '.ps1',
-                '.sql', '.r', '.m', '.scala', '.kt', '.swift', '.dart', '.lua'
-            }
-            
-            file_ext = os.path.splitext(file_path)[1].lower()
-            if file_ext not in text_extensions:
+            file_ext = _split_ext(file_path)[1].lower()
+            if file_ext not in _TEXT_EXTENSIONS:
                 logger.debug(f"Skipping binary file: {file_path} (extension: {file_ext})")
                 return None
                 
-            # Try to read as text file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                logger.debug(f"Successfully read text file: {file_path} ({len(content)} chars)")
-                return content
+            # Stream-decode instead of read()+decode of the whole file:
+            # peak memory stays at one buffer and invalid UTF-8 aborts
+            # before the rest of the file is read
+            # Oversized files are cut off at the content cap (plus slack
+            # for the sanitizer) instead of being read in full
+            read_limit = getattr(self.config, 'max_content_bytes',
+                                 1_000_000) + (64 << 10)
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            parts = []
+            total = 0
+            buffer = bytearray(1 << 20)
+            view = memoryview(buffer)
+            with open(file_path, 'rb') as f:
+                while (read := f.readinto(buffer)):
+                    parts.append(decoder.decode(view[:read]))
+                    total += read
+                    if total >= read_limit:
+                        logger.debug(f"Content cap reached for {file_path}, "
+                                     f"truncating read at {total} bytes")
+                        break
+                else:
+                    parts.append(decoder.decode(b'', final=True))
+            content = ''.join(parts)
+            logger.debug(f"Successfully read text file: {file_path} ({len(content)} chars)")
+            return content
                 
         except UnicodeDecodeError as e:
             logger.debug(f"File is not valid UTF-8 text, skipping: {file_path} - {e}")
@@ -130,53 +575,78 @@ class AbstractIndexer(ABC):
 
     def _validate_file_for_indexing(self, file_path: str) -> bool:
         """Validate if a file should be indexed."""
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             logger.warning(f"File does not exist: {file_path}")
             if file_path in self.file_hashes:
                 del self.file_hashes[file_path]
-                self._save_hashes()
+                self._append_hash_record(file_path, None)
             return False
-            
+
         if self._should_skip_file(file_path):
             return False
-            
-        # Check if file has changed
-        current_hash = self._get_file_hash(file_path)
+
+        # Unchanged size and mtime means unchanged content for our purposes;
+        # skip the full re-hash entirely
+        entry = self.file_hashes.get(file_path)
+        if entry and entry.get('size') == stat.st_size \
+                and entry.get('mtime_ns') == stat.st_mtime_ns:
+            logger.debug(f"File unchanged (stat match), skipping: {file_path}")
+            return False
+
+        # Stat changed (or first sighting): confirm with the content hash,
+        # preferring a digest the bulk pre-hash pass already computed
+        current_hash = self._prehashed.pop(file_path, None)
+        if current_hash is None:
+            current_hash = self._get_file_hash(file_path)
         if not current_hash:
             return False
-            
-        if file_path in self.file_hashes and self.file_hashes[file_path] == current_hash:
+
+        if entry and entry.get('sha256') == current_hash:
+            # Content identical despite a stat change (e.g. touch); refresh
+            # the recorded stats so the next pass skips the hash again
+            entry['size'] = stat.st_size
+            entry['mtime_ns'] = stat.st_mtime_ns
+            self._append_hash_record(file_path, entry)
             logger.debug(f"File unchanged, skipping: {file_path}")
             return False
-            
+
+        # Remember the digest so _update_file_hash doesn't re-read the file
+        self._pending_hashes[file_path] = (current_hash, stat.st_size,
+                                           stat.st_mtime_ns)
         return True
 
     def _sanitize_content(self, content: str, file_path: str) -> Optional[str]:
         """Common content sanitization logic."""
         try:
             logger.info(f"Sanitizing content for: {file_path}")
-            # Remove null bytes and other problematic characters
-            content = content.replace('\x00', '')
-            content = content.replace('\r', '\n')
-            
-            # Remove excessive whitespace but preserve meaningful content
-            content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)  # Remove excessive blank lines
-            content = content.strip()
-            
+            if SANITIZE_NATIVE_AVAILABLE:
+                content = _native_sanitize(content, 1000000)
+            else:
+                # Remove null bytes and normalize line endings in one pass;
+                # skip the copy entirely when there is nothing to fix
+                if '\x00' in content or '\r' in content:
+                    content = content.translate(_SANITIZE_TABLE)
+
+                # Remove excessive whitespace but preserve meaningful content
+                content = _RE_BLANKLINES.sub('\n\n', content)  # Remove excessive blank lines
+                content = content.strip()
+
+                # Check content length
+                if len(content) > 1000000:  # 1MB limit
+                    logger.warning(f"Content for {file_path} exceeds 1MB limit, truncating")
+                    content = content[:1000000]
+
             # Ensure content is not empty after sanitization
             if not content:
                 logger.error(f"Content for {file_path} is empty after sanitization - skipping")
                 return None
-            
+
             # If content is very short, add a note to make it searchable
             if len(content) < 10:
                 content = f"File: {os.path.basename(file_path)} - {content}"
             
-            # Check content length
-            if len(content) > 1000000:  # 1MB limit
-                logger.warning(f"Content for {file_path} exceeds 1MB limit, truncating")
-                content = content[:1000000]
-            
             logger.info(f"Content sanitized successfully, length: {len(content)}")
             return content
             
@@ -187,12 +657,33 @@ class AbstractIndexer(ABC):
             logger.error(f"Full traceback: {traceback.format_exc()}")
             return None
 
-    def _update_file_hash(self, file_path: str) -> None:
-        """Update file hash after successful indexing."""
-        current_hash = self._get_file_hash(file_path)
-        if current_hash:
-            self.file_hashes[file_path] = current_hash
-            self._save_hashes()
+    def _update_file_hash(self, file_path: str,
+                          digest: Optional[str] = None) -> None:
+        """Update file hash and stat record after successful indexing.
+
+        Reuses the digest computed during validation (or one passed by the
+        caller) rather than reading and hashing the file a second time.
+        """
+        pending = self._pending_hashes.pop(file_path, None)
+        if digest is None and pending is not None:
+            digest, size, mtime_ns = pending
+        else:
+            if digest is None:
+                digest = self._get_file_hash(file_path)
+            if not digest:
+                return
+            try:
+                stat = os.stat(file_path)
+                size, mtime_ns = stat.st_size, stat.st_mtime_ns
+            except OSError:
+                size, mtime_ns = -1, -1
+        entry = {
+            'sha256': digest,
+            'size': size,
+            'mtime_ns': mtime_ns
+        }
+        self.file_hashes[file_path] = entry
+        self._append_hash_record(file_path, entry)
     
     @abstractmethod
     async def index_file(self, file_path: str) -> None:
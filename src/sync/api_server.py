@@ -1,15 +1,65 @@
 import os
+import copy
+import functools
 import logging
+import logging.handlers
+import queue
 import asyncio
-from typing import Dict, Any, List, Optional
+import re
+import time
+from dataclasses import asdict, is_dataclass
+from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
+# C-implemented 12-hex-char ID source; no UUID object built per call
+from secrets import token_hex
 import marqo
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Header
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
+from pydantic import VERSION as _PYDANTIC_VERSION
 import json
 
+# orjson-backed responses serialize large nested payloads (index
+# listings, search results) several times faster than stdlib json
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+
+    def _marqo_default(o):
+        """Fallback encoder for the few non-JSON leaf types our payloads
+        contain (config dataclasses, pathlib paths)."""
+        if is_dataclass(o):
+            return asdict(o)
+        if isinstance(o, Path):
+            return str(o)
+        raise TypeError
+
+    class MarqoJSONResponse(ORJSONResponse):
+        """ORJSONResponse with our default encoder baked in, so handlers
+        can return config/indexer structures directly without FastAPI's
+        generic jsonable_encoder walk."""
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(
+                content,
+                default=_marqo_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+
+    _DEFAULT_RESPONSE_CLASS = MarqoJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _DEFAULT_RESPONSE_CLASS = JSONResponse
+    ORJSON_AVAILABLE = False
+
+# httpx provides a shared async HTTP client so direct Marqo HTTP calls
+# don't block the event loop the way requests does
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 from .indexer_config import EnhancedSyncConfig
 from .config import SyncConfig
 from .marqo_handlers import check_marqo_compatibility, ensure_specialized_index
@@ -22,17 +72,116 @@ from .env_config import env_config
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Marqo Sync API")
+app = FastAPI(title="Marqo Sync API",
+              default_response_class=_DEFAULT_RESPONSE_CLASS)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+class FastCORS:
+    """Minimal pure-ASGI CORS middleware for the allow-all policy.
+
+    Starlette's CORSMiddleware builds Request/Response objects around
+    every call; since our policy is allow-everything, a header scan plus
+    a send wrapper does the same job without that per-request overhead.
+    Because credentials are allowed, the request Origin is echoed back
+    (with Vary: Origin) rather than sending a wildcard, which browsers
+    reject for credentialed requests; preflights likewise reflect the
+    requested headers.
+    """
+
+    _ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            # Same-origin or non-browser request; nothing to add
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        if scope["method"] == "OPTIONS":
+            # Preflight: answer from the fixed policy without routing
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": cors_headers + [
+                    (b"access-control-allow-methods", self._ALLOW_METHODS),
+                    (b"access-control-allow-headers",
+                     request_headers or b"*"),
+                    (b"access-control-max-age", b"600"),
+                ],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"].extend(cors_headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+app.add_middleware(FastCORS)
 
-class PathValidationRequest(BaseModel):
+from marqo.errors import MarqoWebError, BackendTimeoutError
+
+@app.exception_handler(MarqoWebError)
+async def _marqo_error_handler(request, exc: MarqoWebError):
+    """Map Marqo backend errors to a small JSON envelope.
+
+    Handlers can let Marqo exceptions propagate instead of wrapping
+    every body in a blanket try/except; the success path then builds no
+    traceback machinery at all.
+    """
+    status = getattr(exc, 'status_code', None)
+    if not isinstance(status, int) or status < 400:
+        status = 502
+    return _DEFAULT_RESPONSE_CLASS(
+        status_code=status,
+        content={"success": False, "error": str(getattr(exc, 'message', exc))}
+    )
+
+@app.exception_handler(BackendTimeoutError)
+async def _marqo_timeout_handler(request, exc: BackendTimeoutError):
+    return _DEFAULT_RESPONSE_CLASS(
+        status_code=504,
+        content={"success": False, "error": "Marqo backend timed out"}
+    )
+
+class APIRequest(BaseModel):
+    """Base class for request bodies.
+
+    Handlers never mutate nested request data, so under pydantic v1 the
+    deep copy normally made for every nested model/field during
+    validation is skipped (v2 never copies). Unknown fields are rejected
+    up front as 422s rather than silently dropped.
+    """
+    if _PYDANTIC_VERSION.startswith('1.'):
+        class Config:
+            copy_on_model_validation = 'none'
+            extra = 'forbid'
+    else:
+        model_config = {'extra': 'forbid'}
+
+class PathValidationRequest(APIRequest):
     path: str
 
 class PathValidationResponse(BaseModel):
@@ -42,10 +191,10 @@ class PathValidationResponse(BaseModel):
     readable: bool
     error: Optional[str] = None
 
-class MarqoConnectionRequest(BaseModel):
+class MarqoConnectionRequest(APIRequest):
     url: str
 
-class ConfigUpdateRequest(BaseModel):
+class ConfigUpdateRequest(APIRequest):
     marqo_url: Optional[str] = None
     codebases: Optional[List[Dict[str, str]]] = None
     codex: Optional[List[Dict[str, str]]] = None
@@ -58,76 +207,290 @@ class ServiceState:
     def __init__(self):
         self.marqo_client: Optional[marqo.Client] = None
         self.config: Optional[EnhancedSyncConfig] = None
-        self.indexers: Dict[str, Any] = {}
-        self.watchers: Dict[str, Any] = {}
-        self.status: str = "stopped"
+        self._indexers: Dict[str, Any] = {}
+        self._watchers: Dict[str, Any] = {}
+        self._status: str = "stopped"
+        # Version counter bumped on every status/indexers/watchers
+        # assignment; lets /api/status serve a pre-serialized response
+        self._status_version: int = 0
+        self._status_cache: Optional[tuple] = None  # (version, ts, bytes)
+        self.http: Optional["httpx.AsyncClient"] = None
+        # Pooled keep-alive clients per Marqo URL
+        self.marqo_http_pool: Dict[str, "httpx.AsyncClient"] = {}
+
+    @property
+    def indexers(self) -> Dict[str, Any]:
+        return self._indexers
+
+    @indexers.setter
+    def indexers(self, value: Dict[str, Any]) -> None:
+        self._indexers = value
+        self._status_version += 1
+
+    @property
+    def watchers(self) -> Dict[str, Any]:
+        return self._watchers
+
+    @watchers.setter
+    def watchers(self, value: Dict[str, Any]) -> None:
+        self._watchers = value
+        self._status_version += 1
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str) -> None:
+        self._status = value
+        self._status_version += 1
 
 service_state = ServiceState()
 
+# Dashboard polling hits these paths constantly; memoize the expensive
+# probes so repeat calls are served from memory
+_client_cache: Dict[str, tuple] = {}   # url -> (client, monotonic timestamp)
+_CLIENT_TTL = 300.0
+_indexes_cache: Optional[tuple] = None  # (monotonic timestamp, payload)
+_INDEXES_TTL = 5.0
+# Indexes already confirmed/created this process; probe each at most once
+_ensured_indexes: set = set()
+
+# marqo.Client capabilities are class-level, so probe them once at
+# import time instead of hasattr() reflection on every request
+_CLIENT_HAS_LIST_INDEXES = hasattr(marqo.Client, 'list_indexes')
+_CLIENT_HAS_GET_STATS = hasattr(marqo.Client, 'get_stats')
+
+def _tune_marqo_session() -> None:
+    """Widen the connection pool on the requests Session shared by all
+    marqo clients.
+
+    The SDK routes every call through one module-level Session whose
+    default adapters keep only 10 pooled connections; with handlers now
+    fanning Marqo calls out across threads that cap becomes the
+    bottleneck. Also adds a small connection-level retry with backoff.
+    """
+    try:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        from marqo import _httprequests
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        _httprequests.session.mount('http://', adapter)
+        _httprequests.session.mount('https://', adapter)
+    except Exception as e:
+        logger.debug(f"Could not tune marqo HTTP session: {e}")
+
+_tune_marqo_session()
+
+def _tune_marqo_encoder() -> None:
+    """Swap the marqo SDK's request-body encoder for orjson.
+
+    send_request serializes every outbound body through the module's
+    json reference; pointing that at an orjson-backed shim makes bulk
+    add_documents payloads several times cheaper to encode. Inputs
+    orjson can't handle (e.g. tuples, exotic keys) fall back to stdlib
+    json, matching the SDK's original behavior.
+    """
+    if not ORJSON_AVAILABLE:
+        return
+    try:
+        from marqo import _httprequests
+
+        class _OrjsonEncoder:
+            @staticmethod
+            def dumps(obj: Any) -> bytes:
+                try:
+                    return orjson.dumps(
+                        obj,
+                        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                    )
+                except TypeError:
+                    return json.dumps(obj).encode('utf-8')
+
+        _httprequests.json = _OrjsonEncoder
+    except Exception as e:
+        logger.debug(f"Could not tune marqo JSON encoder: {e}")
+
+_tune_marqo_encoder()
+
+def _get_config() -> EnhancedSyncConfig:
+    """Return the cached service config, parsing the environment once."""
+    if service_state.config is None:
+        service_state.config = EnhancedSyncConfig.from_env()
+    return service_state.config
+
 def get_marqo_client(url: str) -> marqo.Client:
+    cached = _client_cache.get(url)
+    if cached and time.monotonic() - cached[1] < _CLIENT_TTL:
+        return cached[0]
     try:
         client = marqo.Client(url=url)
         check_marqo_compatibility(client)
+        _client_cache[url] = (client, time.monotonic())
         return client
     except Exception as e:
         logger.error(f"Failed to create Marqo client: {e}")
         raise HTTPException(status_code=400, detail=f"Failed to connect to Marqo: {str(e)}")
 
+@app.on_event("startup")
+async def _open_http_client():
+    if HTTPX_AVAILABLE:
+        service_state.http = httpx.AsyncClient(timeout=5.0)
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+@app.on_event("startup")
+async def _offload_log_io():
+    # Route records through a queue so handler I/O (stderr/file writes)
+    # happens on a background thread instead of inside request handlers
+    global _log_listener
+    if _log_listener is not None:
+        return
+    root = logging.getLogger()
+    handlers = [h for h in root.handlers
+                if not isinstance(h, logging.handlers.QueueHandler)]
+    if not handlers:
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    _log_listener.start()
+
+@app.on_event("startup")
+async def _warm_config():
+    # Parse env/config files once at startup rather than per request
+    _get_config()
+
+@app.on_event("shutdown")
+async def _close_http_client():
+    if service_state.http is not None:
+        await service_state.http.aclose()
+        service_state.http = None
+    for pooled in service_state.marqo_http_pool.values():
+        await pooled.aclose()
+    service_state.marqo_http_pool.clear()
+
+@app.on_event("shutdown")
+async def _stop_log_listener():
+    global _log_listener
+    if _log_listener is not None:
+        listener, _log_listener = _log_listener, None
+        listener.stop()
+        # Reattach the original handlers so late log lines still land
+        logging.getLogger().handlers = list(listener.handlers)
+
+def _pool_for(url: str) -> "httpx.AsyncClient":
+    """Return the pooled keep-alive client for a Marqo URL, creating it
+    lazily so repeat calls reuse existing TCP/TLS connections."""
+    url = url.rstrip('/')
+    pooled = service_state.marqo_http_pool.get(url)
+    if pooled is None:
+        pooled = httpx.AsyncClient(
+            base_url=url,
+            limits=httpx.Limits(max_keepalive_connections=20,
+                                max_connections=50),
+            timeout=5.0
+        )
+        service_state.marqo_http_pool[url] = pooled
+    return pooled
+
+def _get_index(client: marqo.Client, index_name: str):
+    """Return a cached Index handle for this client.
+
+    client.index() allocates a fresh Index object on every call; the
+    handles are stateless, so they're memoized on the client instance
+    (which shares the client's own cache lifetime).
+    """
+    cache = getattr(client, '_index_handles', None)
+    if cache is None:
+        cache = {}
+        try:
+            client._index_handles = cache
+        except AttributeError:
+            return client.index(index_name)
+    idx = cache.get(index_name)
+    if idx is None:
+        idx = cache[index_name] = client.index(index_name)
+    return idx
+
+def _ensure_index_once(client: marqo.Client, index_name: str) -> None:
+    """Run ensure_specialized_index at most once per index per process."""
+    if index_name not in _ensured_indexes:
+        ensure_specialized_index(client, index_name)
+        _ensured_indexes.add(index_name)
+
+# Watcher flags can flip without a state reassignment, so the cached
+# status bytes also age out quickly
+_STATUS_TTL = 1.0
+
 @app.get("/api/status")
 async def get_status():
-    return {
+    cached = service_state._status_cache
+    if (cached and cached[0] == service_state._status_version
+            and time.monotonic() - cached[1] < _STATUS_TTL):
+        return Response(content=cached[2], media_type="application/json")
+
+    payload = {
         "status": service_state.status,
         "indexers": {
             name: {
                 "type": type(idx).__name__,
-                "index_name": idx.config.index_name if hasattr(idx, 'config') else None
+                "index_name": getattr(getattr(idx, 'config', None), 'index_name', None)
             }
             for name, idx in service_state.indexers.items()
         },
         "watchers": {
             name: {
-                "root_dir": watcher.root_dir if hasattr(watcher, 'root_dir') else None,
-                "watching": watcher.watching if hasattr(watcher, 'watching') else False
+                "root_dir": getattr(watcher, 'root_dir', None),
+                "watching": getattr(watcher, 'watching', False)
             }
             for name, watcher in service_state.watchers.items()
         }
     }
+    body = orjson.dumps(payload) if ORJSON_AVAILABLE \
+        else json.dumps(payload).encode('utf-8')
+    service_state._status_cache = (
+        service_state._status_version, time.monotonic(), body)
+    return Response(content=body, media_type="application/json")
 
 @app.get("/api/config")
 async def get_config():
     try:
-        if service_state.config:
-            config_dict = {
-                "marqo_url": service_state.config.marqo_url,
-                "max_file_size_bytes": service_state.config.max_file_size_bytes,
-                "store_large_files_metadata_only": service_state.config.store_large_files_metadata_only,
-                "indexers": []
+        config = _get_config()
+        config_dict = {
+            "marqo_url": config.marqo_url,
+            "max_file_size_bytes": config.max_file_size_bytes,
+            "store_large_files_metadata_only": config.store_large_files_metadata_only,
+            "indexers": []
+        }
+
+        for idx_config in config.indexers:
+            idx_dict = {
+                "indexer_type": idx_config.indexer_type,
+                "index_name": idx_config.index_name,
+                "source_dir": idx_config.source_dir,
+                "enabled": idx_config.enabled,
+                "settings": idx_config.settings
             }
-            
-            for idx_config in service_state.config.indexers:
-                idx_dict = {
-                    "indexer_type": idx_config.indexer_type,
-                    "index_name": idx_config.index_name,
-                    "source_dir": idx_config.source_dir,
-                    "enabled": idx_config.enabled,
-                    "settings": idx_config.settings
-                }
-                config_dict["indexers"].append(idx_dict)
-            
-            return config_dict
-        else:
-            config = EnhancedSyncConfig.from_env()
-            service_state.config = config
-            return await get_config()
+            config_dict["indexers"].append(idx_dict)
+
+        return config_dict
     except Exception as e:
         logger.error(f"Error getting config: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/config")
-async def update_config(request: ConfigUpdateRequest):
+async def update_config(request: ConfigUpdateRequest, background: BackgroundTasks):
     try:
-        config = EnhancedSyncConfig.from_env()
-        
+        # Mutate a copy so concurrent readers keep seeing the old config
+        # until the new one has been saved successfully
+        config = copy.deepcopy(_get_config())
+
         if request.marqo_url:
             config.marqo_url = request.marqo_url
         
@@ -187,9 +550,12 @@ async def update_config(request: ConfigUpdateRequest):
             conv_config.settings["conversation_types"] = conv_types
         
         config_file = env_config.get_sync_config_file() or env_config.get_default_config_file()
-        save_config_to_file(config, config_file)
-        
+
+        # Swap the in-memory config now and let the disk write happen
+        # after the response; the atomic replace in save_config_to_file
+        # means a crash mid-write never leaves a half-written file
         service_state.config = config
+        background.add_task(save_config_to_file, config, config_file)
         return {"success": True, "message": "Configuration updated"}
     except Exception as e:
         logger.error(f"Error updating config: {e}")
@@ -206,216 +572,263 @@ def save_config_to_file(config: EnhancedSyncConfig, file_path: str):
         }
         
         for idx_config in config.indexers:
-            settings = {}
-            for key, value in idx_config.settings.items():
-                if isinstance(value, list):
-                    settings[key] = [list(item) if isinstance(item, tuple) else item for item in value]
-                else:
-                    settings[key] = value
-            
             idx_dict = {
                 "indexer_type": idx_config.indexer_type,
                 "index_name": idx_config.index_name,
                 "source_dir": idx_config.source_dir,
                 "enabled": idx_config.enabled,
-                "settings": settings
+                "settings": idx_config.settings
             }
             config_dict["indexers"].append(idx_dict)
-        
-        with open(file_path, 'w') as f:
-            yaml.dump(config_dict, f, default_flow_style=False)
+
+        # Normalize tuples and other JSON-ish types in one C-level pass
+        # instead of walking the settings dicts in Python
+        if ORJSON_AVAILABLE:
+            config_dict = orjson.loads(orjson.dumps(config_dict))
+        else:
+            config_dict = json.loads(json.dumps(config_dict))
+
+        # Write to a sibling temp file and rename into place so readers
+        # never observe a partially written config
+        tmp_path = f"{file_path}.tmp"
+        if file_path.endswith('.json'):
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2)
+                        if ORJSON_AVAILABLE
+                        else json.dumps(config_dict, indent=2).encode('utf-8'))
+        else:
+            # libyaml's C emitter when available; pure-Python otherwise
+            try:
+                from yaml import CDumper as _Dumper
+            except ImportError:
+                from yaml import Dumper as _Dumper
+            with open(tmp_path, 'w') as f:
+                yaml.dump(config_dict, f, Dumper=_Dumper,
+                          default_flow_style=False, sort_keys=False)
+        os.replace(tmp_path, file_path)
     except Exception as e:
         logger.error(f"Error saving config to file: {e}")
         raise
 
+async def _probe_index(client: marqo.Client, index_name: str) -> Dict[str, Any]:
+    """Fetch one index's info and stats concurrently off the event loop."""
+    def _info():
+        try:
+            info = client.get_index(index_name)
+            return info if isinstance(info, dict) else {}
+        except Exception as e:
+            logger.debug(f"Could not get index info for {index_name}: {e}")
+            return {}
+
+    def _stats():
+        try:
+            get_stats = getattr(_get_index(client, index_name), 'get_stats', None)
+            if get_stats is not None:
+                return get_stats()
+            if _CLIENT_HAS_GET_STATS:
+                all_stats = client.get_stats()
+                if isinstance(all_stats, dict) and 'indexes' in all_stats:
+                    return all_stats['indexes'].get(index_name, {})
+        except Exception as e:
+            logger.debug(f"Could not get stats for {index_name}: {e}")
+        return {}
+
+    try:
+        index_info, stats = await asyncio.gather(
+            asyncio.to_thread(_info), asyncio.to_thread(_stats))
+
+        # Extract document count
+        doc_count = 0
+        if isinstance(stats, dict):
+            doc_count = stats.get('numberOfDocuments', stats.get('number_of_documents', stats.get('document_count', 0)))
+        elif hasattr(stats, 'numberOfDocuments'):
+            doc_count = stats.numberOfDocuments
+        elif hasattr(stats, 'number_of_documents'):
+            doc_count = stats.number_of_documents
+
+        # Extract size
+        size = 0
+        if isinstance(stats, dict):
+            size = stats.get('indexSize', stats.get('index_size', stats.get('size', 0)))
+        elif hasattr(stats, 'indexSize'):
+            size = stats.indexSize
+        elif hasattr(stats, 'index_size'):
+            size = stats.index_size
+
+        logger.debug(f"Added index: {index_name} with {doc_count} documents")
+        return {
+            "name": index_name,
+            "type": _determine_index_type(index_name),
+            "document_count": doc_count,
+            "size": size,
+            "settings": index_info.get('settings', {}) if isinstance(index_info, dict) else {}
+        }
+    except Exception as e:
+        logger.warning(f"Error getting info for index {index_name}: {e}")
+        return {
+            "name": index_name,
+            "type": _determine_index_type(index_name),
+            "document_count": 0,
+            "size": 0,
+            "error": str(e)
+        }
+
+async def _discover_index_names(client: marqo.Client) -> List[str]:
+    """Find the names of all indexes, trying the cheapest source first."""
+    index_names = []
+
+    # Method 1: One pooled request to the HTTP /indexes endpoint; this
+    # is the fastest path and skips the SDK fallbacks entirely
+    try:
+        import requests
+        # Get marqo_url from the cached config or the client
+        marqo_url = getattr(_get_config(), 'marqo_url', None)
+        if not marqo_url and hasattr(client, 'url'):
+            marqo_url = client.url
+
+        if marqo_url:
+            # Remove trailing slash
+            marqo_url = marqo_url.rstrip('/')
+            if HTTPX_AVAILABLE:
+                response = await _pool_for(marqo_url).get("/indexes")
+            else:
+                response = await asyncio.to_thread(
+                    requests.get, f"{marqo_url}/indexes", timeout=5)
+            if response.status_code == 200:
+                data = response.json()
+                if isinstance(data, dict):
+                    index_names = data.get('results', [])
+                elif isinstance(data, list):
+                    index_names = data
+                logger.info(f"Got {len(index_names)} indexes from HTTP API")
+    except Exception as e:
+        logger.debug(f"HTTP API method failed: {e}")
+
+    # Method 2: Try list_indexes() if the SDK provides it
+    if not index_names and _CLIENT_HAS_LIST_INDEXES:
+        try:
+            result = await asyncio.to_thread(client.list_indexes)
+            if isinstance(result, dict):
+                index_names = result.get('results', [])
+            elif isinstance(result, list):
+                index_names = result
+            logger.info(f"Got {len(index_names)} indexes from list_indexes()")
+        except Exception as e:
+            logger.warning(f"list_indexes() failed: {e}")
+
+    # Method 3: Try get_stats() to extract index names
+    if not index_names and _CLIENT_HAS_GET_STATS:
+        try:
+            stats = await asyncio.to_thread(client.get_stats)
+            if isinstance(stats, dict):
+                if 'indexes' in stats:
+                    index_names = list(stats['indexes'].keys())
+                elif 'results' in stats:
+                    index_names = stats['results']
+            logger.info(f"Got {len(index_names)} indexes from get_stats()")
+        except Exception as e:
+            logger.warning(f"Could not get index list from stats: {e}")
+
+    # Method 4: Fallback to known indexes, probed concurrently
+    if not index_names:
+        logger.info("No indexes found via API methods, checking known indexes")
+        known_indexes = ['codebase', 'codex', 'conversations', 'profiles', 'memories', 'categories', 'conversation_messages']
+        probes = await asyncio.gather(
+            *(asyncio.to_thread(client.get_index, idx_name)
+              for idx_name in known_indexes),
+            return_exceptions=True
+        )
+        for idx_name, probe in zip(known_indexes, probes):
+            if isinstance(probe, Exception):
+                logger.debug(f"Known index {idx_name} does not exist: {probe}")
+            else:
+                index_names.append(idx_name)
+                logger.debug(f"Found known index: {idx_name}")
+
+    return index_names
+
 @app.get("/api/indexes")
 async def get_indexes():
+    global _indexes_cache
+    if _indexes_cache and time.monotonic() - _indexes_cache[0] < _INDEXES_TTL:
+        return _indexes_cache[1]
     try:
         if not service_state.marqo_client:
-            config = EnhancedSyncConfig.from_env()
-            service_state.marqo_client = get_marqo_client(config.marqo_url)
-        
+            service_state.marqo_client = get_marqo_client(_get_config().marqo_url)
+
         client = service_state.marqo_client
-        indexes = []
-        index_names = []
-        
+
         try:
-            # Try multiple methods to get index list
-            # Method 1: Try list_indexes() if available
-            if hasattr(client, 'list_indexes'):
-                try:
-                    result = client.list_indexes()
-                    if isinstance(result, dict):
-                        index_names = result.get('results', [])
-                    elif isinstance(result, list):
-                        index_names = result
-                    logger.info(f"Got {len(index_names)} indexes from list_indexes()")
-                except Exception as e:
-                    logger.warning(f"list_indexes() failed: {e}")
-            
-            # Method 2: Try get_stats() to extract index names
-            if not index_names:
-                try:
-                    stats = client.get_stats()
-                    if isinstance(stats, dict):
-                        if 'indexes' in stats:
-                            index_names = list(stats['indexes'].keys())
-                        elif 'results' in stats:
-                            index_names = stats['results']
-                    logger.info(f"Got {len(index_names)} indexes from get_stats()")
-                except Exception as e:
-                    logger.warning(f"Could not get index list from stats: {e}")
-            
-            # Method 3: Try to get index names from index() method
-            if not index_names:
-                try:
-                    # Try to get all indexes by attempting to access them
-                    # This is a fallback method
-                    all_stats = client.get_stats()
-                    if isinstance(all_stats, dict) and 'indexes' in all_stats:
-                        index_names = list(all_stats['indexes'].keys())
-                except Exception as e:
-                    logger.debug(f"Could not extract index names from stats: {e}")
-            
-            # Method 4: Try HTTP API directly
-            if not index_names:
-                try:
-                    import requests
-                    # Get marqo_url from config or service_state
-                    marqo_url = None
-                    if 'config' in locals() and hasattr(config, 'marqo_url'):
-                        marqo_url = config.marqo_url
-                    elif service_state.config and hasattr(service_state.config, 'marqo_url'):
-                        marqo_url = service_state.config.marqo_url
-                    elif hasattr(client, 'url'):
-                        marqo_url = client.url
-                    
-                    if marqo_url:
-                        # Remove trailing slash
-                        marqo_url = marqo_url.rstrip('/')
-                        response = requests.get(f"{marqo_url}/indexes", timeout=5)
-                        if response.status_code == 200:
-                            data = response.json()
-                            if isinstance(data, dict):
-                                index_names = data.get('results', [])
-                            elif isinstance(data, list):
-                                index_names = data
-                            logger.info(f"Got {len(index_names)} indexes from HTTP API")
-                except Exception as e:
-                    logger.debug(f"HTTP API method failed: {e}")
-            
-            # Method 5: Fallback to known indexes
-            if not index_names:
-                logger.info("No indexes found via API methods, checking known indexes")
-                known_indexes = ['codebase', 'codex', 'conversations', 'profiles', 'memories', 'categories', 'conversation_messages']
-                for idx_name in known_indexes:
-                    try:
-                        client.get_index(idx_name)
-                        index_names.append(idx_name)
-                        logger.debug(f"Found known index: {idx_name}")
-                    except Exception as e:
-                        logger.debug(f"Known index {idx_name} does not exist: {e}")
-                        pass
-            
+            index_names = await _discover_index_names(client)
             logger.info(f"Processing {len(index_names)} indexes")
-            
-            # Process each index
-            for index_name in index_names:
-                try:
-                    index_info = {}
-                    stats = {}
-                    
-                    # Get index info
-                    try:
-                        index_info = client.get_index(index_name)
-                        if not isinstance(index_info, dict):
-                            index_info = {}
-                    except Exception as e:
-                        logger.debug(f"Could not get index info for {index_name}: {e}")
-                    
-                    # Get index stats
-                    try:
-                        index_obj = client.index(index_name)
-                        if hasattr(index_obj, 'get_stats'):
-                            stats = index_obj.get_stats()
-                        elif hasattr(client, 'get_stats'):
-                            all_stats = client.get_stats()
-                            if isinstance(all_stats, dict) and 'indexes' in all_stats:
-                                stats = all_stats['indexes'].get(index_name, {})
-                    except Exception as e:
-                        logger.debug(f"Could not get stats for {index_name}: {e}")
-                    
-                    # Extract document count
-                    doc_count = 0
-                    if isinstance(stats, dict):
-                        doc_count = stats.get('numberOfDocuments', stats.get('number_of_documents', stats.get('document_count', 0)))
-                    elif hasattr(stats, 'numberOfDocuments'):
-                        doc_count = stats.numberOfDocuments
-                    elif hasattr(stats, 'number_of_documents'):
-                        doc_count = stats.number_of_documents
-                    
-                    # Extract size
-                    size = 0
-                    if isinstance(stats, dict):
-                        size = stats.get('indexSize', stats.get('index_size', stats.get('size', 0)))
-                    elif hasattr(stats, 'indexSize'):
-                        size = stats.indexSize
-                    elif hasattr(stats, 'index_size'):
-                        size = stats.index_size
-                    
-                    indexes.append({
-                        "name": index_name,
-                        "type": _determine_index_type(index_name),
-                        "document_count": doc_count,
-                        "size": size,
-                        "settings": index_info.get('settings', {}) if isinstance(index_info, dict) else {}
-                    })
-                    logger.debug(f"Added index: {index_name} with {doc_count} documents")
-                except Exception as e:
-                    logger.warning(f"Error getting info for index {index_name}: {e}")
-                    indexes.append({
-                        "name": index_name,
-                        "type": _determine_index_type(index_name),
-                        "document_count": 0,
-                        "size": 0,
-                        "error": str(e)
-                    })
-            
+
+            # Probe every index concurrently; each costs two blocking HTTP
+            # round-trips, so fanning out collapses O(2N*rtt) to ~O(rtt)
+            indexes = await asyncio.gather(
+                *(_probe_index(client, index_name) for index_name in index_names)
+            )
+
             logger.info(f"Returning {len(indexes)} indexes")
         except Exception as e:
             logger.error(f"Error listing indexes: {e}", exc_info=True)
             # Don't raise here, return empty list with error info
             return {"indexes": [], "error": str(e)}
-        
-        return {"indexes": indexes}
+
+        payload = {"indexes": indexes}
+        _indexes_cache = (time.monotonic(), payload)
+        return payload
     except Exception as e:
         logger.error(f"Error getting indexes: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/indexes/stream")
+async def stream_indexes():
+    """Stream index details as NDJSON, one line per index.
+
+    Each probe result is written as soon as it completes, so the
+    dashboard can render fast indexes immediately instead of waiting on
+    the slowest one.
+    """
+    try:
+        if not service_state.marqo_client:
+            service_state.marqo_client = get_marqo_client(_get_config().marqo_url)
+
+        client = service_state.marqo_client
+        index_names = await _discover_index_names(client)
+    except Exception as e:
+        logger.error(f"Error preparing index stream: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def _generate():
+        tasks = [asyncio.ensure_future(_probe_index(client, name))
+                 for name in index_names]
+        for completed in asyncio.as_completed(tasks):
+            info = await completed
+            if ORJSON_AVAILABLE:
+                yield orjson.dumps(info) + b"\n"
+            else:
+                yield (json.dumps(info) + "\n").encode()
+
+    return StreamingResponse(_generate(), media_type="application/x-ndjson")
+
+# One compiled pattern replaces the ladder of lower()/startswith/in
+# checks; alternatives are tried in ladder order against the whole name
+# and the matched named group is the index type. The (?-i:...) groups
+# keep the original exact-equality checks case-sensitive.
+_TYPE_RE = re.compile(
+    r"(?P<codebase>.*codebase.*)"
+    r"|(?P<codex>.*codex.*)"
+    r"|(?P<conversations>conversations?-.*|(?-i:conversations|conversation_messages))"
+    r"|(?P<profiles>.*profile.*)"
+    r"|(?P<memories>.*memory.*|(?-i:memories))"
+    r"|(?P<categories>.*category.*|(?-i:categories))",
+    re.IGNORECASE | re.DOTALL
+)
+
+@functools.lru_cache(maxsize=256)
 def _determine_index_type(index_name: str) -> str:
-    index_name_lower = index_name.lower()
-    # Check for project-specific codebase indexes (e.g., "codebase-project1", "codebase-myapp")
-    if index_name_lower.startswith("codebase-") or (index_name_lower.startswith("codebase") and "-" in index_name_lower):
-        return "codebase"
-    elif index_name == "codebase" or "codebase" in index_name_lower:
-        return "codebase"
-    # Check for project-specific codex indexes
-    elif index_name_lower.startswith("codex-") or (index_name_lower.startswith("codex") and "-" in index_name_lower):
-        return "codex"
-    elif index_name == "codex" or "codex" in index_name_lower:
-        return "codex"
-    # Check for conversation-specific indexes (e.g., "conversations-chatgpt", "conversations-claude")
-    elif index_name_lower.startswith("conversations-") or index_name_lower.startswith("conversation-"):
-        return "conversations"
-    elif index_name == "conversations" or (index_name == "conversation_messages"):
-        return "conversations"
-    elif index_name == "profiles" or "profile" in index_name_lower:
-        return "profiles"
-    elif index_name == "memories" or "memory" in index_name_lower:
-        return "memories"
-    elif index_name == "categories" or "category" in index_name_lower:
-        return "categories"
-    return "unknown"
+    match = _TYPE_RE.fullmatch(index_name)
+    return match.lastgroup if match else "unknown"
 
 def _extract_project_name(index_name: str) -> str:
     """Extract project/conversation name from index name."""
@@ -428,12 +841,8 @@ def _extract_project_name(index_name: str) -> str:
 @app.get("/api/indexers")
 async def get_indexers():
     try:
-        if not service_state.config:
-            config = EnhancedSyncConfig.from_env()
-            service_state.config = config
-        
         indexers_list = []
-        for indexer_config in service_state.config.indexers:
+        for indexer_config in _get_config().indexers:
             indexers_list.append({
                 "indexer_type": indexer_config.indexer_type,
                 "index_name": indexer_config.index_name,
@@ -452,88 +861,111 @@ async def get_watchers():
     for name, watcher in service_state.watchers.items():
         watchers_list.append({
             "name": name,
-            "root_dir": watcher.root_dir if hasattr(watcher, 'root_dir') else None,
-            "watching": watcher.watching if hasattr(watcher, 'watching') else False
+            "root_dir": getattr(watcher, 'root_dir', None),
+            "watching": getattr(watcher, 'watching', False)
         })
     return {"watchers": watchers_list}
 
 @app.post("/api/validate-path")
 async def validate_path(request: PathValidationRequest):
-    path = Path(request.path)
-    
-    response = {
-        "valid": False,
-        "exists": False,
-        "is_directory": False,
-        "readable": False,
-        "error": None
-    }
-    
-    try:
-        if path.exists():
-            response["exists"] = True
-            if path.is_dir():
-                response["is_directory"] = True
-                if os.access(path, os.R_OK):
-                    response["readable"] = True
-                    response["valid"] = True
+    def _probe(path: Path) -> dict:
+        # Blocking stat/access syscalls; run off the event loop since
+        # slow filesystems (NFS, container binds) can stall for a while
+        response = {
+            "valid": False,
+            "exists": False,
+            "is_directory": False,
+            "readable": False,
+            "error": None
+        }
+        try:
+            if path.exists():
+                response["exists"] = True
+                if path.is_dir():
+                    response["is_directory"] = True
+                    if os.access(path, os.R_OK):
+                        response["readable"] = True
+                        response["valid"] = True
+                    else:
+                        response["error"] = "Directory exists but is not readable"
                 else:
-                    response["error"] = "Directory exists but is not readable"
+                    response["error"] = "Path exists but is not a directory"
             else:
-                response["error"] = "Path exists but is not a directory"
-        else:
-            response["error"] = "Path does not exist"
-    except Exception as e:
-        response["error"] = str(e)
-    
-    return response
+                response["error"] = "Path does not exist"
+        except Exception as e:
+            response["error"] = str(e)
+        return response
+
+    return await asyncio.to_thread(_probe, Path(request.path))
+
+# Rapid repeated "Test" clicks return the previous result instead of
+# re-probing the server each time
+_test_conn_cache: Dict[str, tuple] = {}  # url -> (monotonic ts, result)
+_TEST_CONN_TTL = 2.0
 
 @app.post("/api/test-connection")
 async def test_connection(request: MarqoConnectionRequest):
+    cached = _test_conn_cache.get(request.url)
+    if cached and time.monotonic() - cached[0] < _TEST_CONN_TTL:
+        return cached[1]
+
     try:
-        client = get_marqo_client(request.url)
-        
+        # Hits the URL-keyed client cache; compatibility is only checked
+        # when a new client has to be built
+        client = await asyncio.to_thread(get_marqo_client, request.url)
+
         index_count = 0
         try:
-            if hasattr(client, 'list_indexes'):
-                indexes = client.list_indexes()
+            if HTTPX_AVAILABLE:
+                # One pooled request against the URL being tested
+                response = await _pool_for(request.url).get("/indexes")
+                if response.status_code == 200:
+                    data = response.json()
+                    if isinstance(data, dict):
+                        index_count = len(data.get('results', []))
+                    elif isinstance(data, list):
+                        index_count = len(data)
+            elif _CLIENT_HAS_LIST_INDEXES:
+                indexes = await asyncio.to_thread(client.list_indexes)
                 index_count = len(indexes.get('results', []))
-            else:
-                try:
-                    stats = client.get_stats()
-                    if isinstance(stats, dict) and 'indexes' in stats:
-                        index_count = len(stats['indexes'])
-                except:
-                    pass
+            elif _CLIENT_HAS_GET_STATS:
+                stats = await asyncio.to_thread(client.get_stats)
+                if isinstance(stats, dict) and 'indexes' in stats:
+                    index_count = len(stats['indexes'])
         except:
             pass
-        
-        return {
+
+        result = {
             "success": True,
             "message": "Connection successful",
             "index_count": index_count
         }
     except Exception as e:
-        return {
+        result = {
             "success": False,
             "message": str(e)
         }
 
+    _test_conn_cache[request.url] = (time.monotonic(), result)
+    return result
+
 @app.get("/api/index-stats/{index_name}")
 async def get_index_stats(index_name: str):
     try:
         if not service_state.marqo_client:
-            config = EnhancedSyncConfig.from_env()
-            service_state.marqo_client = get_marqo_client(config.marqo_url)
+            service_state.marqo_client = get_marqo_client(_get_config().marqo_url)
         
         client = service_state.marqo_client
         stats = {}
         
         try:
-            if hasattr(client.index(index_name), 'get_stats'):
-                stats = client.index(index_name).get_stats()
+            index_obj = _get_index(client, index_name)
+            get_stats = getattr(index_obj, 'get_stats', None)
+            if get_stats is not None:
+                stats = await asyncio.to_thread(get_stats)
             else:
-                search_result = client.index(index_name).search("", limit=1)
+                search_result = await asyncio.to_thread(
+                    index_obj.search, "", limit=1)
                 stats = {
                     "numberOfDocuments": search_result.get('total', 0) if isinstance(search_result, dict) else 0
                 }
@@ -548,40 +980,38 @@ async def get_index_stats(index_name: str):
 
 @app.get("/api/integration/search")
 async def search_index(index_name: str, query: str, limit: int = 10):
-    try:
-        if not service_state.marqo_client:
-            config = EnhancedSyncConfig.from_env()
-            service_state.marqo_client = get_marqo_client(config.marqo_url)
-        
-        client = service_state.marqo_client
-        results = client.index(index_name).search(query, limit=limit)
-        return {"results": results}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    if not service_state.marqo_client:
+        service_state.marqo_client = get_marqo_client(_get_config().marqo_url)
+    
+    client = service_state.marqo_client
+    results = await asyncio.to_thread(
+        _get_index(client, index_name).search, query, limit=limit)
+    if ORJSON_AVAILABLE:
+        # Serialize directly, skipping FastAPI's jsonable_encoder pass
+        return MarqoJSONResponse(content={"results": results})
+    return {"results": results}
 
 @app.get("/api/integration/index-info")
 async def get_index_info_for_integration(index_name: str):
+    if not service_state.marqo_client:
+        service_state.marqo_client = get_marqo_client(_get_config().marqo_url)
+    
+    client = service_state.marqo_client
+    index_info = await asyncio.to_thread(client.get_index, index_name)
+
     try:
-        if not service_state.marqo_client:
-            config = EnhancedSyncConfig.from_env()
-            service_state.marqo_client = get_marqo_client(config.marqo_url)
-        
-        client = service_state.marqo_client
-        index_info = client.get_index(index_name)
-        
-        try:
-            stats = client.index(index_name).get_stats() if hasattr(client.index(index_name), 'get_stats') else {}
-        except:
-            stats = {}
-        
-        return {
-            "name": index_name,
-            "type": _determine_index_type(index_name),
-            "document_count": stats.get('numberOfDocuments', 0) if isinstance(stats, dict) else 0,
-            "settings": index_info.get('settings', {}) if isinstance(index_info, dict) else {}
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        get_stats = getattr(_get_index(client, index_name), 'get_stats', None)
+        stats = await asyncio.to_thread(get_stats) \
+            if get_stats is not None else {}
+    except:
+        stats = {}
+    
+    return {
+        "name": index_name,
+        "type": _determine_index_type(index_name),
+        "document_count": stats.get('numberOfDocuments', 0) if isinstance(stats, dict) else 0,
+        "settings": index_info.get('settings', {}) if isinstance(index_info, dict) else {}
+    }
 
 @app.get("/api/integration/health")
 async def integration_health():
@@ -591,14 +1021,14 @@ async def integration_health():
         "version": "1.0.0"
     }
 
-class ProfileRequest(BaseModel):
+class ProfileRequest(APIRequest):
     profile_id: str
     name: Optional[str] = None
     email: Optional[str] = None
     tenant_id: Optional[str] = None
     preferences: Optional[Dict[str, Any]] = None
 
-class AgentProfileRequest(BaseModel):
+class AgentProfileRequest(APIRequest):
     profile_id: str
     name: Optional[str] = None
     description: Optional[str] = None
@@ -607,7 +1037,7 @@ class AgentProfileRequest(BaseModel):
     model_config: Optional[Dict[str, Any]] = None
     memory_config: Optional[Dict[str, Any]] = None
 
-class ConversationRequest(BaseModel):
+class ConversationRequest(APIRequest):
     conversation_id: Optional[str] = None
     thread_id: Optional[str] = None
     tenant_id: Optional[str] = None
@@ -615,14 +1045,14 @@ class ConversationRequest(BaseModel):
     category: Optional[str] = None
     participants: Optional[Dict[str, List[str]]] = None
 
-class MessageRequest(BaseModel):
+class MessageRequest(APIRequest):
     conversation_id: str
     thread_id: str
     role: str
     content: str
     turn_number: int
 
-class MemoryRequest(BaseModel):
+class MemoryRequest(APIRequest):
     memory_id: Optional[str] = None
     memory_type: str
     tenant_id: Optional[str] = None
@@ -632,222 +1062,212 @@ class MemoryRequest(BaseModel):
     importance_score: float = 0.5
     tags: Optional[List[str]] = None
 
-class CategoryRequest(BaseModel):
+class CategoryRequest(APIRequest):
     category_id: str
     name: str
     description: Optional[str] = None
     parent_category_id: Optional[str] = None
     tenant_id: Optional[str] = None
 
-def get_profile_manager():
+# Manager providers are injected via Depends and memoized per Marqo
+# client: the first request constructs the instance (and its read
+# caches), later requests reuse it, and a reconnect or URL change that
+# reassigns service_state.marqo_client rebuilds the manager against the
+# new client instead of keeping a stale one. Tests swap providers with
+# app.dependency_overrides.
+_manager_cache: Dict[str, Any] = {}
+
+def _cached_manager(key: str, build):
     if not service_state.marqo_client:
-        config = EnhancedSyncConfig.from_env()
-        service_state.marqo_client = get_marqo_client(config.marqo_url)
-    ensure_specialized_index(service_state.marqo_client, "profiles")
-    return ProfileManager(service_state.marqo_client)
+        service_state.marqo_client = get_marqo_client(_get_config().marqo_url)
+    client = service_state.marqo_client
+    manager = _manager_cache.get(key)
+    if manager is None or manager.marqo_client is not client:
+        manager = _manager_cache[key] = build(client)
+    return manager
+
+def get_profile_manager():
+    def build(client):
+        _ensure_index_once(client, "profiles")
+        return ProfileManager(client)
+    return _cached_manager("profiles", build)
 
 def get_conversation_manager():
-    if not service_state.marqo_client:
-        config = EnhancedSyncConfig.from_env()
-        service_state.marqo_client = get_marqo_client(config.marqo_url)
-    ensure_specialized_index(service_state.marqo_client, "conversations")
-    ensure_specialized_index(service_state.marqo_client, "conversation_messages")
-    return ConversationManager(service_state.marqo_client)
+    def build(client):
+        _ensure_index_once(client, "conversations")
+        _ensure_index_once(client, "conversation_messages")
+        return ConversationManager(client)
+    return _cached_manager("conversations", build)
 
 def get_memory_manager():
-    if not service_state.marqo_client:
-        config = EnhancedSyncConfig.from_env()
-        service_state.marqo_client = get_marqo_client(config.marqo_url)
-    ensure_specialized_index(service_state.marqo_client, "memories")
-    return MemoryManager(service_state.marqo_client)
+    def build(client):
+        _ensure_index_once(client, "memories")
+        return MemoryManager(client)
+    return _cached_manager("memories", build)
 
 def get_category_manager():
-    if not service_state.marqo_client:
-        config = EnhancedSyncConfig.from_env()
-        service_state.marqo_client = get_marqo_client(config.marqo_url)
-    ensure_specialized_index(service_state.marqo_client, "categories")
-    return CategoryManager(service_state.marqo_client)
+    def build(client):
+        _ensure_index_once(client, "categories")
+        return CategoryManager(client)
+    return _cached_manager("categories", build)
 
 @app.post("/api/profiles")
-async def create_profile(request: ProfileRequest):
-    try:
-        manager = get_profile_manager()
-        profile = UserProfile(
-            profile_id=request.profile_id,
-            name=request.name,
-            email=request.email,
-            tenant_id=request.tenant_id,
-            preferences=request.preferences or {}
-        )
-        success = manager.create_user_profile(profile)
-        if success:
-            return {"success": True, "profile_id": request.profile_id}
-        raise HTTPException(status_code=500, detail="Failed to create profile")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def create_profile(request: ProfileRequest, manager: ProfileManager = Depends(get_profile_manager)):
+    profile = UserProfile(
+        profile_id=request.profile_id,
+        name=request.name,
+        email=request.email,
+        tenant_id=request.tenant_id,
+        preferences=request.preferences or {}
+    )
+    success = await asyncio.to_thread(manager.create_user_profile, profile)
+    if success:
+        return {"success": True, "profile_id": request.profile_id}
+    raise HTTPException(status_code=500, detail="Failed to create profile")
 
 @app.get("/api/profiles/{profile_id}")
-async def get_profile(profile_id: str):
-    try:
-        manager = get_profile_manager()
-        profile = manager.get_profile(profile_id)
-        if profile:
-            return profile
-        raise HTTPException(status_code=404, detail="Profile not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_profile(profile_id: str, manager: ProfileManager = Depends(get_profile_manager)):
+    profile = await asyncio.to_thread(manager.get_profile, profile_id)
+    if profile:
+        return profile
+    raise HTTPException(status_code=404, detail="Profile not found")
 
 @app.put("/api/profiles/{profile_id}")
-async def update_profile(profile_id: str, updates: Dict[str, Any]):
-    try:
-        manager = get_profile_manager()
-        success = manager.update_profile(profile_id, updates)
-        if success:
-            return {"success": True}
-        raise HTTPException(status_code=500, detail="Failed to update profile")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def update_profile(profile_id: str, updates: Dict[str, Any], manager: ProfileManager = Depends(get_profile_manager)):
+    success = await asyncio.to_thread(manager.update_profile, profile_id, updates)
+    if success:
+        return {"success": True}
+    raise HTTPException(status_code=500, detail="Failed to update profile")
 
 @app.get("/api/profiles")
-async def list_profiles(tenant_id: Optional[str] = None, profile_type: Optional[str] = None, query: str = ""):
-    try:
-        manager = get_profile_manager()
-        profiles = manager.search_profiles(query, tenant_id, profile_type)
-        return {"profiles": profiles}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def list_profiles(tenant_id: Optional[str] = None, profile_type: Optional[str] = None, query: str = "", manager: ProfileManager = Depends(get_profile_manager)):
+    profiles = await asyncio.to_thread(manager.search_profiles, query, tenant_id, profile_type)
+    return {"profiles": profiles}
 
 @app.post("/api/agents")
-async def create_agent(request: AgentProfileRequest):
-    try:
-        manager = get_profile_manager()
-        profile = AgentProfile(
-            profile_id=request.profile_id,
-            name=request.name,
-            description=request.description,
-            tenant_id=request.tenant_id,
-            capabilities=request.capabilities or [],
-            model_config=request.model_config or {},
-            memory_config=request.memory_config or {}
-        )
-        success = manager.create_agent_profile(profile)
-        if success:
-            return {"success": True, "profile_id": request.profile_id}
-        raise HTTPException(status_code=500, detail="Failed to create agent")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def create_agent(request: AgentProfileRequest, manager: ProfileManager = Depends(get_profile_manager)):
+    profile = AgentProfile(
+        profile_id=request.profile_id,
+        name=request.name,
+        description=request.description,
+        tenant_id=request.tenant_id,
+        capabilities=request.capabilities or [],
+        model_config=request.model_config or {},
+        memory_config=request.memory_config or {}
+    )
+    success = await asyncio.to_thread(manager.create_agent_profile, profile)
+    if success:
+        return {"success": True, "profile_id": request.profile_id}
+    raise HTTPException(status_code=500, detail="Failed to create agent")
 
 @app.post("/api/conversations")
-async def create_conversation(request: ConversationRequest):
-    try:
-        import uuid
-        manager = get_conversation_manager()
-        
-        conv_id = request.conversation_id or f"conv_{uuid.uuid4().hex[:12]}"
-        thread_id = request.thread_id or f"thread_{uuid.uuid4().hex[:12]}"
-        
-        metadata = ConversationMetadata(
-            conversation_id=conv_id,
-            thread_id=thread_id,
-            tenant_id=request.tenant_id,
-            topic=request.topic,
-            category=request.category,
-            participants=request.participants or {}
-        )
-        success = manager.create_conversation(metadata)
-        if success:
-            return {"success": True, "conversation_id": conv_id, "thread_id": thread_id}
-        raise HTTPException(status_code=500, detail="Failed to create conversation")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def create_conversation(request: ConversationRequest, manager: ConversationManager = Depends(get_conversation_manager)):
+    
+    conv_id = request.conversation_id or f"conv_{token_hex(6)}"
+    thread_id = request.thread_id or f"thread_{token_hex(6)}"
+    
+    metadata = ConversationMetadata(
+        conversation_id=conv_id,
+        thread_id=thread_id,
+        tenant_id=request.tenant_id,
+        topic=request.topic,
+        category=request.category,
+        participants=request.participants or {}
+    )
+    success = await asyncio.to_thread(manager.create_conversation, metadata)
+    if success:
+        return {"success": True, "conversation_id": conv_id, "thread_id": thread_id}
+    raise HTTPException(status_code=500, detail="Failed to create conversation")
 
 @app.get("/api/conversations/{conversation_id}")
-async def get_conversation(conversation_id: str):
-    try:
-        manager = get_conversation_manager()
-        conversation = manager.get_conversation(conversation_id)
-        if conversation:
-            messages = manager.get_conversation_messages(conversation_id)
-            conversation['messages'] = messages
-            return conversation
-        raise HTTPException(status_code=404, detail="Conversation not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_conversation(conversation_id: str, limit: int = 100,
+                           before_turn: Optional[int] = None,
+                           after_turn: Optional[int] = None, manager: ConversationManager = Depends(get_conversation_manager)):
+    conversation = await asyncio.to_thread(manager.get_conversation, conversation_id)
+    if conversation:
+        # One page of messages; long conversations are fetched with
+        # repeated calls using next_cursor as after_turn
+        messages = await asyncio.to_thread(
+            manager.get_conversation_messages, conversation_id,
+            limit, before_turn, after_turn)
+        conversation['messages'] = messages
+        conversation['next_cursor'] = (
+            messages[-1].get('turn_number')
+            if messages and len(messages) == limit else None)
+        return conversation
+    raise HTTPException(status_code=404, detail="Conversation not found")
 
 @app.post("/api/conversations/{conversation_id}/messages")
-async def add_message(conversation_id: str, request: MessageRequest):
-    try:
-        import uuid
-        manager = get_conversation_manager()
-        
-        message = ConversationMessage(
-            message_id=f"msg_{uuid.uuid4().hex[:12]}",
+async def add_message(conversation_id: str, request: MessageRequest, manager: ConversationManager = Depends(get_conversation_manager)):
+    
+    # Turn-keyed ids make retried posts idempotent and let readers fetch
+    # turn ranges with get_documents instead of a filtered search
+    message = ConversationMessage(
+        message_id=ConversationManager.message_doc_id(
+            conversation_id, request.turn_number),
+        conversation_id=conversation_id,
+        thread_id=request.thread_id,
+        role=request.role,
+        content=request.content,
+        turn_number=request.turn_number
+    )
+    success = await manager.add_message_async(message)
+    if success:
+        return {"success": True, "message_id": message.message_id}
+    raise HTTPException(status_code=500, detail="Failed to add message")
+
+@app.post("/api/conversations/{conversation_id}/messages/bulk")
+async def add_messages_bulk(conversation_id: str, request: List[MessageRequest], manager: ConversationManager = Depends(get_conversation_manager)):
+
+    messages = [
+        ConversationMessage(
+            message_id=ConversationManager.message_doc_id(
+                conversation_id, item.turn_number),
             conversation_id=conversation_id,
-            thread_id=request.thread_id,
-            role=request.role,
-            content=request.content,
-            turn_number=request.turn_number
+            thread_id=item.thread_id,
+            role=item.role,
+            content=item.content,
+            turn_number=item.turn_number
         )
-        success = manager.add_message(message)
-        if success:
-            return {"success": True, "message_id": message.message_id}
-        raise HTTPException(status_code=500, detail="Failed to add message")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        for item in request
+    ]
+    # Entire burst lands in a single Marqo write
+    success = await asyncio.to_thread(manager.add_messages_bulk, messages)
+    if success:
+        return {"success": True,
+                "message_ids": [message.message_id for message in messages]}
+    raise HTTPException(status_code=500, detail="Failed to add messages")
 
 @app.get("/api/conversations")
-async def list_conversations(tenant_id: Optional[str] = None, status: Optional[str] = None, query: str = ""):
-    try:
-        manager = get_conversation_manager()
-        conversations = manager.search_conversations(query, tenant_id, status)
-        return {"conversations": conversations}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def list_conversations(tenant_id: Optional[str] = None, status: Optional[str] = None, query: str = "", manager: ConversationManager = Depends(get_conversation_manager)):
+    conversations = await asyncio.to_thread(manager.search_conversations, query, tenant_id, status)
+    return {"conversations": conversations}
 
 @app.post("/api/conversations/{conversation_id}/archive")
-async def archive_conversation(conversation_id: str):
-    try:
-        manager = get_conversation_manager()
-        success = manager.archive_conversation(conversation_id)
-        if success:
-            return {"success": True}
-        raise HTTPException(status_code=500, detail="Failed to archive conversation")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def archive_conversation(conversation_id: str, manager: ConversationManager = Depends(get_conversation_manager)):
+    success = await asyncio.to_thread(manager.archive_conversation, conversation_id)
+    if success:
+        return {"success": True}
+    raise HTTPException(status_code=500, detail="Failed to archive conversation")
 
 @app.post("/api/memories")
-async def store_memory(request: MemoryRequest):
-    try:
-        import uuid
-        manager = get_memory_manager()
-        
-        memory_id = request.memory_id or f"mem_{uuid.uuid4().hex[:12]}"
-        memory = Memory(
-            memory_id=memory_id,
-            memory_type=MemoryType(request.memory_type),
-            tenant_id=request.tenant_id,
-            agent_id=request.agent_id,
-            user_id=request.user_id,
-            content=request.content,
-            importance_score=request.importance_score,
-            tags=request.tags or []
-        )
-        success = manager.store_memory(memory)
-        if success:
-            return {"success": True, "memory_id": memory_id}
-        raise HTTPException(status_code=500, detail="Failed to store memory")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def store_memory(request: MemoryRequest, manager: MemoryManager = Depends(get_memory_manager)):
+    
+    memory_id = request.memory_id or f"mem_{token_hex(6)}"
+    memory = Memory(
+        memory_id=memory_id,
+        memory_type=MemoryType(request.memory_type),
+        tenant_id=request.tenant_id,
+        agent_id=request.agent_id,
+        user_id=request.user_id,
+        content=request.content,
+        importance_score=request.importance_score,
+        tags=request.tags or []
+    )
+    success = await asyncio.to_thread(manager.store_memory, memory)
+    if success:
+        return {"success": True, "memory_id": memory_id}
+    raise HTTPException(status_code=500, detail="Failed to store memory")
 
 @app.get("/api/memories")
 async def retrieve_memories(
@@ -858,129 +1278,97 @@ async def retrieve_memories(
     memory_type: Optional[str] = None,
     min_importance: float = 0.0,
     limit: int = 10
-):
-    try:
-        manager = get_memory_manager()
-        memories = manager.retrieve_memories(
-            query, tenant_id, agent_id, user_id, memory_type, min_importance, limit
-        )
-        return {"memories": memories}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+, manager: MemoryManager = Depends(get_memory_manager)):
+    memories = await asyncio.to_thread(
+        manager.retrieve_memories,
+        query, tenant_id, agent_id, user_id, memory_type, min_importance, limit
+    )
+    return {"memories": memories}
 
 @app.get("/api/memories/{memory_id}")
-async def get_memory(memory_id: str):
-    try:
-        manager = get_memory_manager()
-        memory = manager.get_memory(memory_id)
-        if memory:
-            return memory
-        raise HTTPException(status_code=404, detail="Memory not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_memory(memory_id: str, manager: MemoryManager = Depends(get_memory_manager)):
+    memory = await asyncio.to_thread(manager.get_memory, memory_id)
+    if memory:
+        return memory
+    raise HTTPException(status_code=404, detail="Memory not found")
 
 @app.put("/api/memories/{memory_id}")
-async def update_memory(memory_id: str, updates: Dict[str, Any]):
-    try:
-        manager = get_memory_manager()
-        success = manager.update_memory(memory_id, updates)
-        if success:
-            return {"success": True}
-        raise HTTPException(status_code=500, detail="Failed to update memory")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def update_memory(memory_id: str, updates: Dict[str, Any], manager: MemoryManager = Depends(get_memory_manager)):
+    success = await asyncio.to_thread(manager.update_memory, memory_id, updates)
+    if success:
+        return {"success": True}
+    raise HTTPException(status_code=500, detail="Failed to update memory")
 
 @app.delete("/api/memories/{memory_id}")
-async def delete_memory(memory_id: str):
-    try:
-        manager = get_memory_manager()
-        success = manager.delete_memory(memory_id)
-        if success:
-            return {"success": True}
-        raise HTTPException(status_code=500, detail="Failed to delete memory")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def delete_memory(memory_id: str, manager: MemoryManager = Depends(get_memory_manager)):
+    success = await asyncio.to_thread(manager.delete_memory, memory_id)
+    if success:
+        return {"success": True}
+    raise HTTPException(status_code=500, detail="Failed to delete memory")
 
 @app.post("/api/categories")
-async def create_category(request: CategoryRequest):
-    try:
-        manager = get_category_manager()
-        category = Category(
-            category_id=request.category_id,
-            name=request.name,
-            description=request.description,
-            parent_category_id=request.parent_category_id,
-            tenant_id=request.tenant_id
+async def create_category(request: Union[CategoryRequest, List[CategoryRequest]], manager: CategoryManager = Depends(get_category_manager)):
+    batch = request if isinstance(request, list) else [request]
+    categories = [
+        Category(
+            category_id=item.category_id,
+            name=item.name,
+            description=item.description,
+            parent_category_id=item.parent_category_id,
+            tenant_id=item.tenant_id
         )
-        success = manager.create_category(category)
-        if success:
-            return {"success": True, "category_id": request.category_id}
-        raise HTTPException(status_code=500, detail="Failed to create category")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        for item in batch
+    ]
+    # One bulk add_documents round trip regardless of payload size
+    success = await asyncio.to_thread(manager.create_categories, categories)
+    if success:
+        if isinstance(request, list):
+            return {"success": True,
+                    "category_ids": [item.category_id for item in batch]}
+        return {"success": True, "category_id": request.category_id}
+    raise HTTPException(status_code=500, detail="Failed to create category")
 
 @app.get("/api/categories")
-async def list_categories(tenant_id: Optional[str] = None, parent_id: Optional[str] = None):
-    try:
-        manager = get_category_manager()
-        categories = manager.list_categories(tenant_id, parent_id)
-        return {"categories": categories}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def list_categories(tenant_id: Optional[str] = None, parent_id: Optional[str] = None, manager: CategoryManager = Depends(get_category_manager)):
+    categories = await asyncio.to_thread(manager.list_categories, tenant_id, parent_id)
+    return {"categories": categories}
 
 @app.get("/api/categories/tree")
-async def get_category_tree(tenant_id: Optional[str] = None):
-    try:
-        manager = get_category_manager()
-        tree = manager.get_category_tree(tenant_id)
-        return tree
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_category_tree(tenant_id: Optional[str] = None, manager: CategoryManager = Depends(get_category_manager)):
+    tree = await asyncio.to_thread(manager.get_category_tree, tenant_id)
+    return tree
 
 @app.get("/api/categories/{category_id}")
-async def get_category(category_id: str):
-    try:
-        manager = get_category_manager()
-        category = manager.get_category(category_id)
-        if category:
-            return category
-        raise HTTPException(status_code=404, detail="Category not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_category(category_id: str, manager: CategoryManager = Depends(get_category_manager)):
+    category = await asyncio.to_thread(manager.get_category, category_id)
+    if category:
+        return category
+    raise HTTPException(status_code=404, detail="Category not found")
 
 @app.put("/api/categories/{category_id}")
-async def update_category(category_id: str, updates: Dict[str, Any]):
-    try:
-        manager = get_category_manager()
-        success = manager.update_category(category_id, updates)
-        if success:
-            return {"success": True}
-        raise HTTPException(status_code=500, detail="Failed to update category")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def update_category(category_id: str, updates: Dict[str, Any],
+                          if_match: Optional[str] = Header(None), manager: CategoryManager = Depends(get_category_manager)):
+    # If-Match carries the updated_at from a prior read; a mismatch
+    # means the category changed underneath the client, so reject
+    # before paying for the write
+    if if_match is not None:
+        current = await asyncio.to_thread(manager.get_category, category_id)
+        if current is None:
+            raise HTTPException(status_code=404, detail="Category not found")
+        if str(current.get('updated_at')) != if_match:
+            raise HTTPException(status_code=412,
+                                detail="Category modified since last read")
+    success = await asyncio.to_thread(manager.update_category, category_id, updates)
+    if success:
+        return {"success": True}
+    raise HTTPException(status_code=500, detail="Failed to update category")
 
 @app.delete("/api/categories/{category_id}")
-async def delete_category(category_id: str):
-    try:
-        manager = get_category_manager()
-        success = manager.delete_category(category_id)
-        if success:
-            return {"success": True}
-        raise HTTPException(status_code=500, detail="Failed to delete category")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def delete_category(category_id: str, manager: CategoryManager = Depends(get_category_manager)):
+    success = await asyncio.to_thread(manager.delete_category, category_id)
+    if success:
+        return {"success": True}
+    raise HTTPException(status_code=500, detail="Failed to delete category")
 
 def set_service_state(state: ServiceState):
     global service_state
@@ -1,7 +1,11 @@
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
+import logging
+import threading
 import time
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class Category:
     category_id: str
@@ -26,55 +30,158 @@ class Category:
         }
 
 class CategoryManager:
-    def __init__(self, marqo_client, index_name: str = "categories"):
+    # Categories are read-heavy and change rarely; reads are served from
+    # an in-process TTL cache invalidated on every mutation
+    _CACHE_TTL = 60.0
+    _CACHE_MAX = 10_000
+
+    # Fields list/tree callers actually use; trimming the synthetic
+    # content field and highlights shrinks every listing payload
+    _LIST_ATTRIBUTES = ['_id', 'name', 'description', 'parent_category_id',
+                        'tenant_id', 'tags', 'metadata', 'document_count',
+                        'created_at', 'updated_at']
+
+    def __init__(self, marqo_client, index_name: str = "categories", batch_size: int = 100):
         self.marqo_client = marqo_client
         self.index_name = index_name
-    
-    def create_category(self, category: Category) -> bool:
+        self.batch_size = batch_size
+        self._pending: List[Dict[str, Any]] = []
+        self._cache_lock = threading.RLock()
+        self._doc_cache: Dict[str, tuple] = {}     # category_id -> (ts, doc)
+        self._list_cache: Dict[tuple, tuple] = {}  # (tenant, parent) -> (ts, hits)
+        self._tree_cache: Dict[Optional[str], tuple] = {}  # tenant -> (ts, tree)
+
+    def _cache_get(self, cache: Dict, key) -> Optional[Any]:
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry and time.monotonic() - entry[0] < self._CACHE_TTL:
+                return entry[1]
+        return None
+
+    def _cache_put(self, cache: Dict, key, value) -> None:
+        with self._cache_lock:
+            if len(cache) >= self._CACHE_MAX:
+                cache.clear()
+            cache[key] = (time.monotonic(), value)
+
+    def _invalidate(self, category_ids: Optional[List[str]] = None) -> None:
+        """Drop cached reads touched by a mutation; list/tree results are
+        cleared wholesale since any write can reshape them."""
+        with self._cache_lock:
+            if category_ids is None:
+                self._doc_cache.clear()
+            else:
+                for category_id in category_ids:
+                    self._doc_cache.pop(category_id, None)
+            self._list_cache.clear()
+            self._tree_cache.clear()
+
+    def flush(self) -> bool:
+        """Write all queued category docs in one add_documents call."""
+        if not self._pending:
+            return True
+        batch, self._pending = self._pending, []
         try:
-            doc = category.to_dict()
-            doc["_id"] = category.category_id
-            self.marqo_client.index(self.index_name).add_documents([doc])
+            self.marqo_client.index(self.index_name).add_documents(batch)
             return True
         except Exception as e:
-            print(f"Error creating category: {e}")
+            logger.exception("Error writing category batch")
             return False
+        finally:
+            self._invalidate([doc["_id"] for doc in batch])
+
+    def create_categories(self, categories: List[Category]) -> bool:
+        """Create many categories with one Marqo round trip per batch_size
+        docs instead of one per category."""
+        success = True
+        for category in categories:
+            doc = category.to_dict()
+            doc["_id"] = category.category_id
+            self._pending.append(doc)
+            if len(self._pending) >= self.batch_size:
+                success = self.flush() and success
+        return self.flush() and success
+
+    def create_category(self, category: Category) -> bool:
+        return self.create_categories([category])
     
     def get_category(self, category_id: str) -> Optional[Dict[str, Any]]:
+        cached = self._cache_get(self._doc_cache, category_id)
+        if cached is not None:
+            return cached
         try:
             results = self.marqo_client.index(self.index_name).get_documents([category_id])
             if results and 'results' in results and results['results']:
-                return results['results'][0]
+                category = results['results'][0]
+                self._cache_put(self._doc_cache, category_id, category)
+                return category
             return None
         except Exception as e:
-            print(f"Error getting category: {e}")
+            logger.exception("Error getting category")
             return None
     
     def update_category(self, category_id: str, updates: Dict[str, Any]) -> bool:
+        if not updates:
+            return True
         try:
+            # Idempotent PUTs (retry storms, dashboard sync) cost nothing
+            # when the cached doc already carries the requested values
+            cached = self._cache_get(self._doc_cache, category_id)
+            if cached is not None:
+                updates = {k: v for k, v in updates.items()
+                           if cached.get(k) != v}
+                if not updates:
+                    return True
+
+            index = self.marqo_client.index(self.index_name)
+            # Partial update when the SDK/index supports it: one round
+            # trip carrying only the changed fields, no read first
+            update_documents = getattr(index, 'update_documents', None)
+            if update_documents is not None:
+                try:
+                    update_documents([{"_id": category_id, **updates,
+                                       "updated_at": time.time()}])
+                    self._invalidate([category_id])
+                    return True
+                except Exception as e:
+                    logger.warning(f"Partial category update failed, falling back: {e}")
+
             category = self.get_category(category_id)
             if not category:
                 return False
-            
-            for key, value in updates.items():
+
+            changes = {k: v for k, v in updates.items()
+                       if category.get(k) != v}
+            if not changes:
+                return True
+
+            for key, value in changes.items():
                 category[key] = value
             category['updated_at'] = time.time()
-            
-            self.marqo_client.index(self.index_name).add_documents([category])
+
+            index.add_documents([category])
+            self._invalidate([category_id])
             return True
         except Exception as e:
-            print(f"Error updating category: {e}")
+            logger.exception("Error updating category")
             return False
     
     def delete_category(self, category_id: str) -> bool:
         try:
             self.marqo_client.index(self.index_name).delete_documents([category_id])
+            self._invalidate([category_id])
             return True
         except Exception as e:
-            print(f"Error deleting category: {e}")
+            logger.exception("Error deleting category")
             return False
     
     def list_categories(self, tenant_id: Optional[str] = None, parent_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        # Callers get per-call copies of the cached dicts so mutating a
+        # result (get_category_tree attaches children, for example) never
+        # pollutes the cache or earlier callers' results
+        cached = self._cache_get(self._list_cache, (tenant_id, parent_id))
+        if cached is not None:
+            return [dict(hit) for hit in cached]
         try:
             filters = []
             if tenant_id:
@@ -85,35 +192,64 @@ class CategoryManager:
                 filters.append("parent_category_id:null")
             
             filter_string = " AND ".join(filters) if filters else None
-            
-            results = self.marqo_client.index(self.index_name).search(
+
+            index = self.marqo_client.index(self.index_name)
+            # Listing is a filter scan, not a relevance query: LEXICAL
+            # skips the embedding/tensor scoring pipeline entirely
+            results = index.search(
                 "",
                 filter_string=filter_string,
-                limit=100
+                limit=100,
+                search_method="LEXICAL",
+                attributes_to_retrieve=self._LIST_ATTRIBUTES,
+                show_highlights=False
             )
-            
-            if results and 'hits' in results:
-                return results['hits']
-            return []
+            hits = results['hits'] if results and 'hits' in results else []
+            if not hits:
+                # Some Marqo versions match nothing on an empty lexical
+                # query; retry once through the tensor path
+                results = index.search(
+                    "",
+                    filter_string=filter_string,
+                    limit=100,
+                    attributes_to_retrieve=self._LIST_ATTRIBUTES
+                )
+                hits = results['hits'] if results and 'hits' in results else []
+            self._cache_put(self._list_cache, (tenant_id, parent_id), hits)
+            return [dict(hit) for hit in hits]
         except Exception as e:
-            print(f"Error listing categories: {e}")
+            logger.exception("Error listing categories")
             return []
     
     def get_category_tree(self, tenant_id: Optional[str] = None) -> Dict[str, Any]:
+        cached = self._cache_get(self._tree_cache, tenant_id)
+        if cached is not None:
+            return cached
         try:
             all_categories = self.list_categories(tenant_id=tenant_id)
-            
+
             root_categories = [c for c in all_categories if not c.get('parent_category_id')]
             category_map = {c['_id']: c for c in all_categories}
-            
-            def build_tree(category):
-                children = [c for c in all_categories if c.get('parent_category_id') == category['_id']]
-                category['children'] = [build_tree(child) for child in children]
-                return category
-            
-            tree = [build_tree(root) for root in root_categories]
-            return {"tree": tree, "map": category_map}
+
+            # One-pass children index so tree assembly is O(N) dict
+            # lookups instead of re-scanning the list for every node
+            children_by_parent: Dict[Any, List[Dict[str, Any]]] = {}
+            for c in all_categories:
+                children_by_parent.setdefault(c.get('parent_category_id'), []).append(c)
+
+            # Iterative build; deep hierarchies don't pay Python frame
+            # overhead or risk the recursion limit
+            stack = list(root_categories)
+            while stack:
+                category = stack.pop()
+                children = children_by_parent.get(category['_id'], [])
+                category['children'] = children
+                stack.extend(children)
+
+            tree = {"tree": root_categories, "map": category_map}
+            self._cache_put(self._tree_cache, tenant_id, tree)
+            return tree
         except Exception as e:
-            print(f"Error building category tree: {e}")
+            logger.exception("Error building category tree")
             return {"tree": [], "map": {}}
 
@@ -47,33 +47,15 @@ class ChatHistoryIndexer:
         # Simply delegate to UniversalIndexer for testing
         await self.universal_indexer.index_directory(directory)
     
-    # Delegate all other methods to UniversalIndexer
-    def _load_hashes(self):
-        return self.universal_indexer._load_hashes()
-    
-    def _save_hashes(self):
-        return self.universal_indexer._save_hashes()
-    
-    def _get_file_hash(self, file_path: str):
-        return self.universal_indexer._get_file_hash(file_path)
-    
-    def _get_file_metadata(self, file_path: str) -> Dict[str, Any]:
-        return self.universal_indexer._get_file_metadata(file_path)
-    
-    def _read_file_content(self, file_path: str) -> Optional[str]:
-        return self.universal_indexer._read_file_content(file_path)
-    
-    def _sanitize_content(self, content: str, file_path: str) -> Optional[str]:
-        return self.universal_indexer._sanitize_content(content, file_path)
-    
-    def _validate_file_for_indexing(self, file_path: str) -> bool:
-        return self.universal_indexer._validate_file_for_indexing(file_path)
-    
-    def _update_file_hash(self, file_path: str) -> None:
-        return self.universal_indexer._update_file_hash(file_path)
-    
-    def _should_skip_file(self, file_path: str) -> bool:
-        return self.universal_indexer._should_skip_file(file_path)
+    def __getattr__(self, name):
+        # Delegate everything else to UniversalIndexer without a wrapper
+        # frame per call; cache the bound attribute so later lookups hit
+        # the instance dict directly
+        if name == 'universal_indexer':
+            raise AttributeError(name)
+        value = getattr(self.universal_indexer, name)
+        setattr(self, name, value)
+        return value
 
 # Re-export functions from marqo_handlers for backward compatibility
 from .marqo_handlers import ensure_index_exists, check_marqo_compatibility
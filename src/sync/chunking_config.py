@@ -1,4 +1,6 @@
 """Configuration for enhanced chunking parameters."""
+import json
+import os
 from dataclasses import dataclass
 from typing import Dict, Any
 from enum import Enum
@@ -11,7 +13,10 @@ class ContentType(Enum):
     MIXED = "mixed"
     UNKNOWN = "unknown"
 
-@dataclass
+# slots drops the per-instance __dict__ and makes the hot
+# max_tokens/overlap_tokens reads slot-offset lookups; frozen lets
+# instances be shared across chunkers safely
+@dataclass(slots=True, frozen=True)
 class ChunkingConfig:
     """Configuration for content-type-specific chunking."""
     max_tokens: int
@@ -68,14 +73,19 @@ class ChunkingConfigManager:
                 quality_threshold=0.6
             )
         }
-    
+        self._unknown = self.configs[ContentType.UNKNOWN]
+
     def get_config(self, content_type: ContentType) -> ChunkingConfig:
         """Get configuration for content type."""
-        return self.configs.get(content_type, self.configs[ContentType.UNKNOWN])
-    
+        # Precomputed fallback avoids the second dict lookup .get's
+        # default argument would pay on every call
+        return self.configs.get(content_type) or self._unknown
+
     def update_config(self, content_type: ContentType, config: ChunkingConfig) -> None:
         """Update configuration for content type."""
         self.configs[content_type] = config
+        if content_type is ContentType.UNKNOWN:
+            self._unknown = config
     
     def get_all_configs(self) -> Dict[ContentType, ChunkingConfig]:
         """Get all configurations."""
@@ -117,23 +127,33 @@ config_manager = ChunkingConfigManager()
 from typing import Optional
 from .env_config import env_config
 
+# Parsed config cached by mtime so spawn workers and autoreloaders
+# don't re-read an unchanged file
+_loaded_config_cache: Dict[str, tuple] = {}  # path -> (mtime, manager)
+
 def load_config_from_env() -> Optional[ChunkingConfigManager]:
     """Load configuration from environment variables."""
     config_file = env_config.get_chunking_config_file()
     if config_file:
         try:
-            import json
+            mtime = os.path.getmtime(config_file)
+            cached = _loaded_config_cache.get(config_file)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
             with open(config_file, 'r') as f:
                 config_dict = json.load(f)
-            return ChunkingConfigManager.from_dict(config_dict)
+            manager = ChunkingConfigManager.from_dict(config_dict)
+            _loaded_config_cache[config_file] = (mtime, manager)
+            return manager
         except Exception as e:
             print(f"Warning: Failed to load config from {config_file}: {e}")
-    
+
     return None
 
-# Load configuration if available
-env_config = load_config_from_env()
-if env_config:
-    config_manager = env_config
+# Load configuration if available; a distinct local keeps the imported
+# env_config module visible to later callers
+_loaded_config = load_config_from_env()
+if _loaded_config:
+    config_manager = _loaded_config
 
 
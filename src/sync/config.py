@@ -4,6 +4,24 @@ from typing import Set
 import os
 from .env_config import env_config
 
+# Deduplicated at module load; the old inline set literal repeated
+# several entries (.pyc, .db, .exe, ...)
+_DEFAULT_SKIP_EXTS = frozenset({
+    '.exe', '.dll', '.pdb', '.bin', '.obj', '.lib', '.a', '.o',
+    '.pyc', '.pyo', '.pyd', '.so', '.dylib', '.sys',
+    '.jpg', '.jpeg', '.png', '.gif', '.ico', '.bmp', '.tiff', '.tga',
+    '.mp3', '.mp4', '.wav', '.avi', '.mov', '.mkv', '.flv', '.webm',
+    '.wma', '.aac', '.ogg', '.flac', '.m4a', '.m4v', '.3gp',
+    '.zip', '.tar', '.gz', '.rar', '.7z', '.bz2', '.xz', '.lzma',
+    '.deb', '.rpm', '.pkg', '.msi', '.dmg', '.iso',
+    '.cache', '.log', '.tmp', '.swp', '.bak', '.old', '.orig',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.ttf', '.otf', '.woff', '.woff2', '.eot',
+    '.class', '.com',
+    '.db', '.sqlite', '.sqlite3', '.mdb', '.accdb', '.fdb',
+    '.ldb', '.ndb', '.ibd', '.myd', '.myi', '.frm'
+})
+
 @dataclass
 class SyncConfig:
     source_dir: str
@@ -13,7 +31,21 @@ class SyncConfig:
     skip_directories: Set[str]
     max_file_size_bytes: int
     store_large_files_metadata_only: bool
-    
+    # Cap on how much of a file is read and indexed; matches the
+    # sanitizer's 1 MB content limit
+    max_content_bytes: int = 1_000_000
+    # Change-detection hash: sha256 (default), or the much faster
+    # blake3/xxh3 when cryptographic strength is not required
+    hash_algorithm: str = 'sha256'
+
+    def __post_init__(self):
+        # Frozen lowercase copy for O(1) extension membership tests
+        self.skip_extensions_set = frozenset(
+            ext.lower() for ext in self.skip_extensions
+        )
+        # Frozen copy of skipped directory names for path-component checks
+        self._skip_dir_parts = frozenset(self.skip_directories)
+
     @classmethod
     def from_env(cls) -> 'SyncConfig':
         """Create configuration from environment variables."""
@@ -38,25 +70,11 @@ class SyncConfig:
             source_dir=source_dir,
             marqo_url=marqo_url,
             index_name=index_name,
-            skip_extensions={
-                '.exe', '.dll', '.pdb', '.bin', '.obj', '.lib', '.a', '.o',
-                '.pyc', '.pyo', '.pyd', '.so', '.dylib', '.dll', '.sys',
-                '.jpg', '.jpeg', '.png', '.gif', '.ico', '.bmp', '.tiff', '.tga',
-                '.mp3', '.mp4', '.wav', '.avi', '.mov', '.mkv', '.flv', '.webm',
-                '.wma', '.aac', '.ogg', '.flac', '.m4a', '.m4v', '.3gp',
-                '.zip', '.tar', '.gz', '.rar', '.7z', '.bz2', '.xz', '.lzma',
-                '.deb', '.rpm', '.pkg', '.msi', '.dmg', '.iso',
-                '.cache', '.log', '.tmp', '.swp', '.bak', '.old', '.orig',
-                '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-                '.db', '.sqlite', '.sqlite3', '.mdb', '.accdb',
-                '.ttf', '.otf', '.woff', '.woff2', '.eot',
-                '.pyc', '.pyo', '.class', '.o', '.obj', '.exe', '.com',
-                '.db', '.sqlite', '.sqlite3', '.mdb', '.accdb', '.fdb',
-                '.ldb', '.ndb', '.ibd', '.myd', '.myi', '.frm'
-            },
+            skip_extensions=_DEFAULT_SKIP_EXTS,
             skip_directories=skip_directories,
             max_file_size_bytes=max_file_size_bytes,
-            store_large_files_metadata_only=store_large_files_metadata_only
+            store_large_files_metadata_only=store_large_files_metadata_only,
+            hash_algorithm=env_config.get_hash_algorithm()
         )
         
         try:
@@ -79,5 +97,11 @@ class SyncConfig:
         
     def should_skip_directory(self, dir_path: str) -> bool:
         """Check if directory should be skipped."""
-        dir_name = os.path.basename(dir_path)
-        return dir_name in self.skip_directories 
\ No newline at end of file
+        # os.path.basename handles both separators on Windows; a bare
+        # rpartition on os.sep misses '/'-separated paths there
+        return os.path.basename(dir_path) in self.skip_directories
+
+    def should_skip_extension(self, file_path: str) -> bool:
+        """Check if a file's extension is in the skip list."""
+        head, sep, ext = file_path.rpartition('.')
+        return bool(sep) and f'.{ext.lower()}' in self.skip_extensions_set
\ No newline at end of file
@@ -59,12 +59,12 @@ class ConfigAdapter:
             ValueError: If no suitable indexer found
         """
         if index_name:
-            # Find indexer with matching name
-            for indexer in enhanced_config.indexers:
-                if indexer.index_name == index_name:
-                    return enhanced_config.to_legacy_config(index_name)
-            
-            raise ValueError(f"No indexer found with name: {index_name}")
+            # to_legacy_config resolves the name through the O(1) index
+            # and raises ValueError itself when it is unknown
+            try:
+                return enhanced_config.to_legacy_config(index_name)
+            except ValueError:
+                raise ValueError(f"No indexer found with name: {index_name}")
         
         # Use first available indexer
         if not enhanced_config.indexers:
@@ -1,15 +1,36 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Dict, Any, Optional, List
+import asyncio
+import atexit
+import functools
+import logging
+import threading
 import time
 from enum import Enum
 
+from .document_model import compile_to_dict
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=256)
+def _conversation_filter(tenant_id: Optional[str], status: Optional[str]) -> Optional[str]:
+    """Composite filter string for a (tenant, status) pair, built once
+    per distinct pair; conversation listings hammer the same handful of
+    combinations."""
+    filters = []
+    if tenant_id:
+        filters.append(f"tenant_id:{tenant_id}")
+    if status:
+        filters.append(f"status:{status}")
+    return " AND ".join(filters) if filters else None
+
 class ConversationStatus(Enum):
     ACTIVE = "active"
     PAUSED = "paused"
     ARCHIVED = "archived"
     DELETED = "deleted"
 
-@dataclass
+@dataclass(slots=True)
 class ConversationMetadata:
     conversation_id: str
     thread_id: str
@@ -35,16 +56,21 @@ class ConversationMetadata:
     summary: Optional[str] = None
     key_points: List[str] = field(default_factory=list)
     
+    # Only status holds an enum; a membership test beats isinstance on
+    # every field
+    _ENUM_FIELDS = frozenset({'status'})
+
     def to_dict(self) -> Dict[str, Any]:
-        result = {}
-        for key, value in self.__dict__.items():
-            if isinstance(value, Enum):
-                result[key] = value.value
-            else:
-                result[key] = value
-        return result
-
-@dataclass
+        enum_fields = self._ENUM_FIELDS
+        return {key: (getattr(self, key).value if key in enum_fields
+                      else getattr(self, key))
+                for key in self._FIELDS}
+
+ConversationMetadata._FIELDS = tuple(
+    f.name for f in fields(ConversationMetadata))
+compile_to_dict(ConversationMetadata)
+
+@dataclass(slots=True)
 class ConversationMessage:
     message_id: str
     conversation_id: str
@@ -71,10 +97,119 @@ class ConversationMessage:
         }
 
 class ConversationManager:
+    # Single messages are buffered and written in one add_documents call
+    # once the buffer fills or ages out; metadata updates coalesce per
+    # conversation within the same window
+    _FLUSH_SIZE = 50
+    _FLUSH_INTERVAL = 1.0
+
     def __init__(self, marqo_client, conversation_index: str = "conversations", message_index: str = "conversation_messages"):
         self.marqo_client = marqo_client
         self.conversation_index = conversation_index
         self.message_index = message_index
+        # Index handles are stateless request builders; constructing
+        # them once keeps every call on the client's pooled keep-alive
+        # session without a per-call handle rebuild
+        self._conv_ix = marqo_client.index(conversation_index)
+        self._msg_ix = marqo_client.index(message_index)
+        self._msg_buffer: List[Dict[str, Any]] = []
+        self._meta_buffer: Dict[str, Dict[str, Any]] = {}
+        self._buffer_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
+
+    def _drain_buffers(self) -> tuple:
+        with self._buffer_lock:
+            batch, self._msg_buffer = self._msg_buffer, []
+            meta, self._meta_buffer = self._meta_buffer, {}
+            self._last_flush = time.monotonic()
+        return batch, meta
+
+    def _write_message_batch(self, batch: List[Dict[str, Any]]) -> bool:
+        try:
+            self._msg_ix.add_documents(batch, client_batch_size=len(batch))
+            return True
+        except Exception as e:
+            logger.exception("Error flushing message buffer")
+            return False
+
+    def flush(self) -> bool:
+        """Write buffered messages and coalesced metadata updates."""
+        batch, meta = self._drain_buffers()
+        if not batch and not meta:
+            return True
+        success = True
+        if batch:
+            success = self._write_message_batch(batch)
+        if meta:
+            success = self._write_metadata_batch(meta) and success
+        return success
+
+    async def flush_async(self) -> bool:
+        """Drain the buffers with the message batch and the metadata
+        batch written concurrently; they target independent indexes, so
+        overlapping the two round trips halves flush latency."""
+        batch, meta = self._drain_buffers()
+        if not batch and not meta:
+            return True
+        tasks = []
+        if batch:
+            tasks.append(asyncio.to_thread(self._write_message_batch, batch))
+        if meta:
+            tasks.append(asyncio.to_thread(self._write_metadata_batch, meta))
+        return all(await asyncio.gather(*tasks))
+
+    def _write_metadata_batch(self, meta: Dict[str, Dict[str, Any]]) -> bool:
+        """Apply coalesced metadata updates with as few round trips as
+        possible: one partial-update call when supported, otherwise one
+        bulk read followed by one bulk rewrite."""
+        update_documents = getattr(self._conv_ix, 'update_documents', None)
+        if update_documents is not None:
+            try:
+                update_documents([{"_id": conversation_id, **updates}
+                                  for conversation_id, updates in meta.items()])
+                return True
+            except Exception as e:
+                logger.warning("Partial metadata batch failed, falling back: %s", e)
+
+        success = True
+        current = self._fetch_conversations(list(meta))
+        docs = []
+        for conversation_id, updates in meta.items():
+            conversation = current.get(conversation_id)
+            if conversation is None:
+                success = False
+                continue
+            conversation.update(updates)
+            docs.append(conversation)
+        if docs:
+            try:
+                self._conv_ix.add_documents(docs, use_existing_tensors=True)
+            except Exception as e:
+                logger.exception("Error writing conversation metadata batch")
+                success = False
+        return success
+
+    def _fetch_conversations(self, conversation_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        try:
+            results = self._conv_ix.get_documents(list(conversation_ids))
+            return {doc['_id']: doc
+                    for doc in results.get('results', [])
+                    if doc.get('_found', True)}
+        except Exception as e:
+            logger.exception("Error getting conversations")
+            return {}
+
+    def get_conversations(self, conversation_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch many conversations in one get_documents round trip.
+
+        Returns a mapping of conversation_id to document; ids that do
+        not exist are simply absent from the result.
+        """
+        if not conversation_ids:
+            return {}
+        self.flush()
+        return self._fetch_conversations(conversation_ids)
     
     def create_conversation(self, metadata: ConversationMetadata) -> bool:
         try:
@@ -83,45 +218,125 @@ class ConversationManager:
                 "content": f"Conversation: {metadata.topic or 'Untitled'}",
                 **metadata.to_dict()
             }
-            self.marqo_client.index(self.conversation_index).add_documents([doc])
+            self._conv_ix.add_documents([doc])
             return True
         except Exception as e:
-            print(f"Error creating conversation: {e}")
+            logger.exception("Error creating conversation")
             return False
     
-    def add_message(self, message: ConversationMessage) -> bool:
+    def add_messages_bulk(self, messages: List[ConversationMessage]) -> bool:
+        """Write a burst of messages in one add_documents round trip,
+        then update each touched conversation's metadata once."""
+        if not messages:
+            return True
         try:
-            doc = message.to_dict()
-            self.marqo_client.index(self.message_index).add_documents([doc])
-            
-            self.update_conversation_metadata(
-                message.conversation_id,
-                {
-                    "current_turn": message.turn_number,
-                    "total_turns": message.turn_number,
-                    "last_message_at": message.timestamp
-                }
-            )
+            docs = [message.to_dict() for message in messages]
+            self._msg_ix.add_documents(
+                docs, client_batch_size=len(docs))
+
+            # Metadata only needs the newest turn per conversation
+            latest: Dict[str, ConversationMessage] = {}
+            for message in messages:
+                current = latest.get(message.conversation_id)
+                if current is None or message.turn_number > current.turn_number:
+                    latest[message.conversation_id] = message
+            for message in latest.values():
+                self.update_conversation_metadata(
+                    message.conversation_id,
+                    {
+                        "current_turn": message.turn_number,
+                        "total_turns": message.turn_number,
+                        "last_message_at": message.timestamp
+                    }
+                )
             return True
         except Exception as e:
-            print(f"Error adding message: {e}")
+            logger.exception("Error adding messages")
             return False
+
+    def _buffer_message(self, message: ConversationMessage) -> bool:
+        """Append one message to the buffers; returns True when a flush
+        is due (size or age trigger)."""
+        with self._buffer_lock:
+            self._msg_buffer.append(message.to_dict())
+            updates = self._meta_buffer.setdefault(message.conversation_id, {})
+            if message.turn_number >= updates.get("current_turn", -1):
+                updates["current_turn"] = message.turn_number
+                updates["total_turns"] = message.turn_number
+            updates["last_message_at"] = max(
+                updates.get("last_message_at", 0.0), message.timestamp)
+            return (len(self._msg_buffer) >= self._FLUSH_SIZE
+                    or time.monotonic() - self._last_flush >= self._FLUSH_INTERVAL)
+
+    def add_message(self, message: ConversationMessage) -> bool:
+        if self._buffer_message(message):
+            return self.flush()
+        return True
+
+    async def add_message_async(self, message: ConversationMessage) -> bool:
+        """add_message for async callers: buffering stays in-process and
+        cheap, and when a flush is due the message upload and metadata
+        upsert run overlapped instead of back to back."""
+        if self._buffer_message(message):
+            return await self.flush_async()
+        return True
     
+    @staticmethod
+    def message_doc_id(conversation_id: str, turn_number: int) -> str:
+        """Stable message id keyed by conversation and turn.
+
+        Encoding both into the id makes turn lookups pure get_documents
+        calls (no filter evaluation) and makes message writes idempotent
+        under retries: the same turn always lands on the same document.
+        """
+        return f"{conversation_id}#{turn_number:06d}"
+
+    def get_messages_by_turn_range(self, conversation_id: str,
+                                   start_turn: int, end_turn: int) -> List[Dict[str, Any]]:
+        """Fetch a contiguous turn range by precomputed ids, skipping the
+        search filter pipeline entirely. Only valid for messages created
+        with message_doc_id-style ids; turns with no document are simply
+        absent from the result."""
+        if end_turn < start_turn:
+            return []
+        self.flush()
+        ids = [self.message_doc_id(conversation_id, turn)
+               for turn in range(start_turn, end_turn + 1)]
+        try:
+            results = self._msg_ix.get_documents(ids)
+            return [doc for doc in results.get('results', [])
+                    if doc.get('_found', True)]
+        except Exception as e:
+            logger.exception("Error getting message range")
+            return []
+
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        # Drain the write buffer first so readers see their own writes
+        self.flush()
         try:
-            results = self.marqo_client.index(self.conversation_index).get_documents([conversation_id])
+            results = self._conv_ix.get_documents([conversation_id])
             if results and 'results' in results and results['results']:
                 return results['results'][0]
             return None
         except Exception as e:
-            print(f"Error getting conversation: {e}")
+            logger.exception("Error getting conversation")
             return None
     
-    def get_conversation_messages(self, conversation_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+    def get_conversation_messages(self, conversation_id: str, limit: int = 100,
+                                  before_turn: Optional[int] = None,
+                                  after_turn: Optional[int] = None) -> List[Dict[str, Any]]:
+        self.flush()
         try:
-            results = self.marqo_client.index(self.message_index).search(
+            filter_string = f"conversation_id:{conversation_id}"
+            # Turn-number cursors let callers page through long
+            # conversations instead of pulling every message at once
+            if before_turn is not None:
+                filter_string += f" AND turn_number:[* TO {before_turn - 1}]"
+            if after_turn is not None:
+                filter_string += f" AND turn_number:[{after_turn + 1} TO *]"
+            results = self._msg_ix.search(
                 "",
-                filter_string=f"conversation_id:{conversation_id}",
+                filter_string=filter_string,
                 limit=limit,
                 sort=["turn_number:asc"]
             )
@@ -129,22 +344,35 @@ class ConversationManager:
                 return results['hits']
             return []
         except Exception as e:
-            print(f"Error getting messages: {e}")
+            logger.exception("Error getting messages")
             return []
     
     def update_conversation_metadata(self, conversation_id: str, updates: Dict[str, Any]) -> bool:
         try:
+            index = self._conv_ix
+            # Partial update when supported: one round trip with just the
+            # changed fields instead of read-merge-write
+            update_documents = getattr(index, 'update_documents', None)
+            if update_documents is not None:
+                try:
+                    update_documents([{"_id": conversation_id, **updates}])
+                    return True
+                except Exception as e:
+                    logger.warning("Partial conversation update failed, falling back: %s", e)
+
             conversation = self.get_conversation(conversation_id)
             if not conversation:
                 return False
-            
+
             for key, value in updates.items():
                 conversation[key] = value
-            
-            self.marqo_client.index(self.conversation_index).add_documents([conversation])
+
+            # The content field is unchanged, so let Marqo reuse its
+            # stored tensors instead of re-embedding the document
+            index.add_documents([conversation], use_existing_tensors=True)
             return True
         except Exception as e:
-            print(f"Error updating conversation: {e}")
+            logger.exception("Error updating conversation")
             return False
     
     def archive_conversation(self, conversation_id: str) -> bool:
@@ -157,19 +385,11 @@ class ConversationManager:
         )
     
     def search_conversations(self, query: str, tenant_id: Optional[str] = None, status: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        self.flush()
         try:
-            filter_string = None
-            filters = []
-            if tenant_id:
-                filters.append(f"tenant_id:{tenant_id}")
-            if status:
-                filters.append(f"status:{status}")
-            if filters:
-                filter_string = " AND ".join(filters)
-            
-            results = self.marqo_client.index(self.conversation_index).search(
+            results = self._conv_ix.search(
                 query,
-                filter_string=filter_string,
+                filter_string=_conversation_filter(tenant_id, status),
                 limit=limit
             )
             
@@ -177,6 +397,6 @@ class ConversationManager:
                 return results['hits']
             return []
         except Exception as e:
-            print(f"Error searching conversations: {e}")
+            logger.exception("Error searching conversations")
             return []
 
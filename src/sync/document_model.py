@@ -1,8 +1,12 @@
-from dataclasses import dataclass, field
+import logging
+import time
+from dataclasses import dataclass, field, fields
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 class DocumentType(Enum):
     CONVERSATION = "conversation"
     DOCUMENT = "document"
@@ -26,7 +30,7 @@ class ConversationRole(Enum):
     ASSISTANT = "assistant"
     SYSTEM = "system"
 
-@dataclass
+@dataclass(slots=True)
 class DocumentMetadata:
     document_type: DocumentType
     category: str
@@ -63,37 +67,84 @@ class DocumentMetadata:
     embedding_model: Optional[str] = None
     search_priority: str = "normal"
     
+    # Which fields hold enums is fixed by the class, so to_dict can
+    # test membership instead of isinstance on every value
+    _ENUM_FIELDS = frozenset({'document_type', 'profile_type',
+                              'access_level', 'conversation_role'})
+
     def to_dict(self) -> Dict[str, Any]:
+        enum_fields = self._ENUM_FIELDS
         result = {}
-        for key, value in self.__dict__.items():
+        for key in self._FIELDS:
+            value = getattr(self, key)
             if value is None:
                 continue
-            if isinstance(value, Enum):
-                result[key] = value.value
-            elif isinstance(value, list):
-                result[key] = value
-            elif isinstance(value, dict):
-                result[key] = value
-            else:
-                result[key] = value
+            result[key] = value.value if key in enum_fields else value
         return result
-    
+
+    # Enum coercions keyed by field; from_dict touches only these four
+    # entries instead of branching per input key
+    _ENUM_COERCERS = {
+        'document_type': DocumentType,
+        'profile_type': ProfileType,
+        'access_level': AccessLevel,
+        'conversation_role': ConversationRole,
+    }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DocumentMetadata':
-        kwargs = {}
-        for key, value in data.items():
-            if key == 'document_type' and isinstance(value, str):
-                kwargs[key] = DocumentType(value)
-            elif key == 'profile_type' and isinstance(value, str):
-                kwargs[key] = ProfileType(value)
-            elif key == 'access_level' and isinstance(value, str):
-                kwargs[key] = AccessLevel(value)
-            elif key == 'conversation_role' and isinstance(value, str):
-                kwargs[key] = ConversationRole(value)
-            else:
-                kwargs[key] = value
+        kwargs = dict(data)
+        for key, enum_cls in cls._ENUM_COERCERS.items():
+            value = kwargs.get(key)
+            if isinstance(value, str):
+                kwargs[key] = enum_cls(value)
         return cls(**kwargs)
 
+# Field order cached once; dataclasses.fields reflection is too slow to
+# rerun per serialized document
+DocumentMetadata._FIELDS = tuple(f.name for f in fields(DocumentMetadata))
+DocumentMetadata._TO_DICT_SKIPS_NONE = True
+
+def compile_to_dict(cls) -> None:
+    """Replace cls.to_dict with an exec-compiled single dict literal.
+
+    The generated body builds the whole result with one BUILD_MAP-style
+    expression instead of a Python-level loop of dict stores, using the
+    class's _ENUM_FIELDS and None-skipping policy. Values are read as
+    plain attributes, which stay direct slot loads on slotted classes.
+    Compilation happens once at import; if it fails for any reason the
+    hand-written loop version stays in place.
+    """
+    try:
+        enum_fields = getattr(cls, '_ENUM_FIELDS', frozenset())
+        skip_none = getattr(cls, '_TO_DICT_SKIPS_NONE', False)
+        parts = []
+        for f in fields(cls):
+            key = f.name
+            access = f"self.{key}"
+            if skip_none:
+                value = "_v.value" if key in enum_fields else "_v"
+                parts.append(
+                    f"**({{{key!r}: {value}}} "
+                    f"if (_v := {access}) is not None else {{}})")
+            else:
+                value = f"{access}.value" if key in enum_fields else access
+                parts.append(f"{key!r}: {value}")
+        body = ",\n        ".join(parts)
+        src = (
+            "def to_dict(self):\n"
+            "    return {\n"
+            f"        {body}\n"
+            "    }\n"
+        )
+        namespace: Dict[str, Any] = {}
+        exec(src, namespace)
+        cls.to_dict = namespace['to_dict']
+    except Exception as e:
+        logger.warning("Could not compile to_dict for %s: %s", cls.__name__, e)
+
+compile_to_dict(DocumentMetadata)
+
 def create_document(
     content: str,
     document_type: DocumentType,
@@ -103,24 +154,23 @@ def create_document(
     user_id: Optional[str] = None,
     **kwargs
 ) -> Dict[str, Any]:
-    import time
-    
+    # One clock read serves the three timestamps and the id suffix
+    now = time.time()
     metadata = DocumentMetadata(
         document_type=document_type,
         category=category,
         tenant_id=tenant_id,
         agent_id=agent_id,
         user_id=user_id,
-        created_at=time.time(),
-        updated_at=time.time(),
-        accessed_at=time.time(),
+        created_at=now,
+        updated_at=now,
+        accessed_at=now,
         **kwargs
     )
-    
-    doc_id = f"{document_type.value}_{category}_{int(time.time())}"
-    if tenant_id:
-        doc_id = f"{tenant_id}_{doc_id}"
-    
+
+    prefix = f"{tenant_id}_" if tenant_id else ""
+    doc_id = f"{prefix}{document_type.value}_{category}_{int(now)}"
+
     return {
         "_id": doc_id,
         "content": content,
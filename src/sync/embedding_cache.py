@@ -0,0 +1,111 @@
+"""LRU caching layer for embedding calls keyed by SHA-256 of model and text."""
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, List
+
+# With numpy available, cached vectors are stored int8-quantized (4x
+# smaller than float32) and only materialized as floats on access
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+class CachedEmbedder:
+    """Bounded LRU cache wrapped around an embedding function.
+
+    Chunks are keyed by SHA-256(model + NUL + text) so identical content is
+    embedded once per model; repeated calls are served from memory instead of
+    issuing redundant network requests.
+    """
+
+    def __init__(self, inner: Callable[[List[str]], List[List[float]]],
+                 capacity: int = 10_000, model_name: str = "default"):
+        """Initialize cached embedder.
+
+        Args:
+            inner: Embedding function taking a list of texts and returning
+                one embedding per text
+            capacity: Maximum number of cached embeddings
+            model_name: Model identifier mixed into the cache key
+        """
+        self.inner = inner
+        self.capacity = capacity
+        self.model_name = model_name
+        self._cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def _key(self, text: str) -> bytes:
+        """Compute the cache key for a text."""
+        return hashlib.sha256((self.model_name + "\0" + text).encode()).digest()
+
+    def embed(self, text: str) -> List[float]:
+        """Embed a single text, serving from cache when possible."""
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, calling the inner function only for cache misses."""
+        if not texts:
+            return []
+
+        keys = [self._key(text) for text in texts]
+        results: List[List[float]] = [None] * len(texts)
+
+        # Partition into hits and misses
+        miss_indices = []
+        for i, key in enumerate(keys):
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                results[i] = self._decode(cached)
+                self._hits += 1
+            else:
+                miss_indices.append(i)
+                self._misses += 1
+
+        # Embed only the misses in one call
+        if miss_indices:
+            miss_texts = [texts[i] for i in miss_indices]
+            embeddings = self.inner(miss_texts)
+            for i, embedding in zip(miss_indices, embeddings):
+                results[i] = embedding
+                self._store(keys[i], embedding)
+
+        return results
+
+    def _encode(self, embedding: List[float]):
+        """Quantize an embedding to (int8 vector, scale) when numpy is present."""
+        if not NUMPY_AVAILABLE:
+            return embedding
+        vec = np.asarray(embedding, dtype=np.float32)
+        scale = float(np.max(np.abs(vec))) / 127.0 if vec.size else 1.0
+        if scale == 0.0:
+            scale = 1.0
+        return (np.round(vec / scale).astype(np.int8), scale)
+
+    def _decode(self, entry) -> List[float]:
+        """Reconstruct a float embedding from a cached entry."""
+        if not NUMPY_AVAILABLE:
+            return entry
+        quantized, scale = entry
+        return (quantized.astype(np.float32) * scale).tolist()
+
+    def _store(self, key: bytes, embedding: List[float]):
+        """Insert an embedding, evicting the least recently used entry if full."""
+        self._cache[key] = self._encode(embedding)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache hit/miss counters and current size."""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'size': len(self._cache),
+            'capacity': self.capacity
+        }
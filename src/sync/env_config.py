@@ -143,6 +143,30 @@ class EnvironmentConfig:
     def get_api_server_host(self) -> str:
         return self._get_str('API_SERVER_HOST', '0.0.0.0')
     
+    def get_api_workers(self) -> int:
+        workers = self._get_int('API_WORKERS', os.cpu_count() or 1)
+        if workers <= 0:
+            logger.warning(f"Invalid API_WORKERS value: {workers}, using 1")
+            workers = 1
+        return workers
+
+    def is_dev(self) -> bool:
+        return self._get_bool('DEV_MODE', False)
+
+    def get_hash_algorithm(self) -> str:
+        algo = self._get_str('HASH_ALGORITHM', 'sha256').lower()
+        if algo not in ('sha256', 'blake3', 'xxh3'):
+            logger.warning(f"Invalid HASH_ALGORITHM value: {algo}, using sha256")
+            algo = 'sha256'
+        return algo
+
+    def get_embed_concurrency(self) -> int:
+        value = self._get_int('EMBED_CONCURRENCY', 16)
+        if value <= 0:
+            logger.warning(f"Invalid EMBED_CONCURRENCY value: {value}, using 16")
+            value = 16
+        return value
+
     def get_api_server_port(self) -> int:
         port = self._get_int('API_SERVER_PORT', 8000)
         if not self._validate_port(port):
@@ -421,7 +421,22 @@ class EnhancedSyncConfig:
             return self.indexers
             
         return [cfg for cfg in self.indexers if cfg.indexer_type == indexer_type]
-        
+
+    def _find_indexer(self, index_name: str) -> Optional[IndexerTypeConfig]:
+        """O(1) lookup of an indexer config by index_name.
+
+        The name index is rebuilt lazily whenever the indexer list has
+        changed size (the _add_* helpers and from_file only ever append),
+        so repeated lookups don't rescan the list. Built in reverse so
+        duplicate names resolve to the first entry, matching the old
+        linear scan.
+        """
+        by_name = getattr(self, '_by_name', None)
+        if by_name is None or len(by_name) != len(self.indexers):
+            by_name = {cfg.index_name: cfg for cfg in reversed(self.indexers)}
+            self._by_name = by_name
+        return by_name.get(index_name)
+
     def to_legacy_config(self, index_name: str):
         """Convert to legacy SyncConfig for backward compatibility.
         
@@ -437,23 +452,24 @@ class EnhancedSyncConfig:
         # Import here to avoid circular imports
         from .config import SyncConfig
         # Return type is SyncConfig, but we use string annotation in method signature to avoid circular imports
-        
-        # Find the indexer config with matching index_name
-        for indexer_config in self.indexers:
-            if indexer_config.index_name == index_name:
-                # Extract settings
-                skip_extensions = indexer_config.settings.get("skip_extensions", set())
-                skip_directories = indexer_config.settings.get("skip_directories", set())
-                
-                # Create legacy config
-                return SyncConfig(
-                    source_dir=indexer_config.source_dir,
-                    marqo_url=self.marqo_url,
-                    index_name=index_name,
-                    skip_extensions=skip_extensions,
-                    skip_directories=skip_directories,
-                    max_file_size_bytes=self.max_file_size_bytes,
-                    store_large_files_metadata_only=self.store_large_files_metadata_only
-                )
-                
-        raise ValueError(f"No indexer found with index_name: {index_name}")
\ No newline at end of file
+
+        # Dict lookup instead of a linear scan; callers converting every
+        # indexer would otherwise pay O(N) per conversion
+        indexer_config = self._find_indexer(index_name)
+        if indexer_config is None:
+            raise ValueError(f"No indexer found with index_name: {index_name}")
+
+        # Extract settings
+        skip_extensions = indexer_config.settings.get("skip_extensions", set())
+        skip_directories = indexer_config.settings.get("skip_directories", set())
+
+        # Create legacy config
+        return SyncConfig(
+            source_dir=indexer_config.source_dir,
+            marqo_url=self.marqo_url,
+            index_name=index_name,
+            skip_extensions=skip_extensions,
+            skip_directories=skip_directories,
+            max_file_size_bytes=self.max_file_size_bytes,
+            store_large_files_metadata_only=self.store_large_files_metadata_only
+        )
\ No newline at end of file
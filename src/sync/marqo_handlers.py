@@ -287,8 +287,10 @@ async def index_document_chunks(client: marqo.Client, index_name: str, file_path
         
         logger.info(f"Successfully created {len(documents)} documents for: {file_path}")
         
-        # Batch index the chunks with resource-aware batching
-        batch_size = get_optimal_batch_size()
+        # Batch index the chunks with resource-aware batching. The
+        # resource probes block on psutil.cpu_percent's sampling window,
+        # so they run off-loop like the other blocking stages
+        batch_size = await asyncio.to_thread(get_optimal_batch_size)
         successful_batches = 0
         total_batches = (len(documents) + batch_size - 1) // batch_size
         
@@ -296,7 +298,7 @@ async def index_document_chunks(client: marqo.Client, index_name: str, file_path
         
         for i in range(0, len(documents), batch_size):
             # Check if we should throttle before processing this batch
-            if should_throttle():
+            if await asyncio.to_thread(should_throttle):
                 logger.info("System under pressure, waiting for resources...")
                 if not await wait_for_resources(timeout=30.0):
                     logger.warning("Timeout waiting for resources, proceeding with reduced batch size")
@@ -311,8 +313,12 @@ async def index_document_chunks(client: marqo.Client, index_name: str, file_path
                 logger.info(f"Index name: {index_name}")
                 logger.info(f"Batch size: {len(batch)}")
                 
-                # For Marqo 3.x, tensor_fields must be explicitly specified
-                result = client.index(index_name).add_documents(
+                # For Marqo 3.x, tensor_fields must be explicitly specified.
+                # add_documents is a blocking HTTP call; run it on a worker
+                # thread so concurrent files overlap instead of pinning the
+                # event loop
+                result = await asyncio.to_thread(
+                    client.index(index_name).add_documents,
                     documents=batch,
                     tensor_fields=['content']  # Explicitly specify content field for vectorization
                 )
@@ -122,16 +122,36 @@ class MemoryManager:
             return None
     
     def update_memory(self, memory_id: str, updates: Dict[str, Any]) -> bool:
+        if not updates:
+            return True
         try:
+            index = self.marqo_client.index(self.index_name)
+            # Partial update when supported: skips the read round trip
+            # and sends only the changed fields
+            update_documents = getattr(index, 'update_documents', None)
+            if update_documents is not None:
+                try:
+                    update_documents([{"_id": memory_id, **updates,
+                                       "updated_at": time.time()}])
+                    return True
+                except Exception as e:
+                    print(f"Partial memory update failed, falling back: {e}")
+
             memory = self.get_memory(memory_id)
             if not memory:
                 return False
-            
-            for key, value in updates.items():
+
+            # No-op updates skip the write round trip entirely
+            changes = {k: v for k, v in updates.items()
+                       if memory.get(k) != v}
+            if not changes:
+                return True
+
+            for key, value in changes.items():
                 memory[key] = value
             memory['updated_at'] = time.time()
-            
-            self.marqo_client.index(self.index_name).add_documents([memory])
+
+            index.add_documents([memory])
             return True
         except Exception as e:
             print(f"Error updating memory: {e}")
@@ -0,0 +1,153 @@
+"""Producer/consumer indexing pipeline with bounded queues.
+
+The pipeline runs four stages (read -> chunk -> embed -> store) as
+concurrent tasks connected by bounded asyncio queues, so disk I/O, CPU
+chunking and network embedding overlap while backpressure from the
+queues keeps memory usage flat.
+"""
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from .enhanced_text_splitter import EnhancedTextSplitter, batch_embed, get_default_splitter
+except ImportError:
+    from enhanced_text_splitter import EnhancedTextSplitter, batch_embed, get_default_splitter
+
+logger = logging.getLogger(__name__)
+
+# Bounded queue size between pipeline stages
+CHANNEL_BUFFER_SIZE = 100
+
+# Documents per storage write
+STORE_BATCH_SIZE = 100
+
+# Sentinel marking the end of a stage's output
+_DONE = object()
+
+async def _read_stage(paths: List[str], out_queue: asyncio.Queue) -> None:
+    """Read file contents off the event loop and feed the chunk stage."""
+    for path in paths:
+        try:
+            content = await asyncio.to_thread(_read_text, path)
+        except Exception as e:
+            logger.error(f"Error reading {path}: {e}")
+            continue
+        if content:
+            await out_queue.put((path, content))
+    await out_queue.put(_DONE)
+
+def _read_text(path: str) -> Optional[str]:
+    """Read a file as UTF-8 text, returning None for unreadable files."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except (UnicodeDecodeError, OSError) as e:
+        logger.debug(f"Skipping unreadable file {path}: {e}")
+        return None
+
+async def _chunk_stage(splitter: EnhancedTextSplitter,
+                       in_queue: asyncio.Queue, out_queue: asyncio.Queue) -> None:
+    """Split each document into chunks and feed the embed stage."""
+    while True:
+        item = await in_queue.get()
+        if item is _DONE:
+            break
+        path, content = item
+        try:
+            result = await splitter.semantic_split_enhanced(content, path)
+        except Exception as e:
+            logger.error(f"Error chunking {path}: {e}")
+            continue
+        for chunk in result.chunks:
+            await out_queue.put((path, chunk))
+    await out_queue.put(_DONE)
+
+async def _embed_stage(embed_fn: Optional[Callable[[List[str]], List[List[float]]]],
+                       in_queue: asyncio.Queue, out_queue: asyncio.Queue) -> None:
+    """Embed chunks in batches and feed the store stage."""
+    pending: List[Any] = []
+
+    async def flush():
+        if not pending:
+            return
+        texts = [chunk for _, chunk in pending]
+        try:
+            embeddings = await batch_embed(texts, embed_fn=embed_fn)
+        except Exception as e:
+            logger.error(f"Error embedding batch of {len(texts)} chunks: {e}")
+            embeddings = [None] * len(texts)
+        for (path, chunk), embedding in zip(pending, embeddings):
+            await out_queue.put((path, chunk, embedding))
+        pending.clear()
+
+    while True:
+        item = await in_queue.get()
+        if item is _DONE:
+            break
+        pending.append(item)
+        if len(pending) >= STORE_BATCH_SIZE:
+            await flush()
+    await flush()
+    await out_queue.put(_DONE)
+
+async def _store_stage(store_fn: Optional[Callable[[List[Dict[str, Any]]], None]],
+                       in_queue: asyncio.Queue, stats: Dict[str, int]) -> None:
+    """Batch embedded chunks into groups and hand them to the store function."""
+    batch: List[Dict[str, Any]] = []
+
+    async def flush():
+        if not batch:
+            return
+        if store_fn is not None:
+            try:
+                await asyncio.to_thread(store_fn, list(batch))
+            except Exception as e:
+                logger.error(f"Error storing batch of {len(batch)} documents: {e}")
+        stats['stored'] += len(batch)
+        batch.clear()
+
+    while True:
+        item = await in_queue.get()
+        if item is _DONE:
+            break
+        path, chunk, embedding = item
+        batch.append({'filepath': path, 'content': chunk, 'embedding': embedding})
+        if len(batch) >= STORE_BATCH_SIZE:
+            await flush()
+    await flush()
+
+async def run_pipeline(paths: List[str],
+                       splitter: Optional[EnhancedTextSplitter] = None,
+                       embed_fn: Optional[Callable[[List[str]], List[List[float]]]] = None,
+                       store_fn: Optional[Callable[[List[Dict[str, Any]]], None]] = None) -> Dict[str, int]:
+    """Run the read -> chunk -> embed -> store pipeline over paths.
+
+    Args:
+        paths: Files to process
+        splitter: Splitter instance to use (a default is created if omitted)
+        embed_fn: Embedding function forwarded to batch_embed
+        store_fn: Callable receiving batches of document dicts; when omitted
+            the documents are counted but not persisted
+
+    Returns:
+        Dict with a 'stored' count of documents that reached the store stage
+    """
+    if splitter is None:
+        splitter = get_default_splitter()
+
+    read_to_chunk: asyncio.Queue = asyncio.Queue(maxsize=CHANNEL_BUFFER_SIZE)
+    chunk_to_embed: asyncio.Queue = asyncio.Queue(maxsize=CHANNEL_BUFFER_SIZE)
+    embed_to_store: asyncio.Queue = asyncio.Queue(maxsize=CHANNEL_BUFFER_SIZE)
+    stats = {'stored': 0}
+
+    tasks = [
+        asyncio.create_task(_read_stage(paths, read_to_chunk)),
+        asyncio.create_task(_chunk_stage(splitter, read_to_chunk, chunk_to_embed)),
+        asyncio.create_task(_embed_stage(embed_fn, chunk_to_embed, embed_to_store)),
+        asyncio.create_task(_store_stage(store_fn, embed_to_store, stats)),
+    ]
+
+    await asyncio.gather(*tasks)
+    logger.info(f"Pipeline processed {len(paths)} paths, stored {stats['stored']} documents")
+    return stats
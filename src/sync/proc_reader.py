@@ -0,0 +1,69 @@
+"""Direct /proc readers for the Linux monitoring hot path.
+
+Parsing /proc files with plain bytes.split over persistent file
+descriptors avoids the per-field Python object construction psutil pays
+on every tick. Callers should guard on PROC_AVAILABLE and fall back to
+psutil on other platforms.
+"""
+import logging
+import os
+import sys
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+PROC_AVAILABLE = sys.platform == 'linux' and os.path.isdir('/proc')
+
+class _ProcFile:
+    """Persistent unbuffered handle on a /proc file, re-read via seek(0)."""
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb', buffering=0)
+
+    def read(self) -> bytes:
+        self._file.seek(0)
+        return self._file.read()
+
+# Pre-opened handles, created lazily on first read
+_meminfo_file = None
+_stat_file = None
+
+def read_meminfo() -> Dict[str, int]:
+    """Parse /proc/meminfo into a dict of field name -> value in kB."""
+    global _meminfo_file
+    if _meminfo_file is None:
+        _meminfo_file = _ProcFile('/proc/meminfo')
+
+    result = {}
+    for line in _meminfo_file.read().split(b'\n'):
+        if not line:
+            continue
+        key, _, rest = line.partition(b':')
+        parts = rest.split()
+        if parts:
+            result[key.decode()] = int(parts[0])
+    return result
+
+def read_stat() -> Dict[str, List[int]]:
+    """Parse the cpu lines of /proc/stat into name -> list of jiffies."""
+    global _stat_file
+    if _stat_file is None:
+        _stat_file = _ProcFile('/proc/stat')
+
+    result = {}
+    for line in _stat_file.read().split(b'\n'):
+        if not line.startswith(b'cpu'):
+            continue
+        parts = line.split()
+        result[parts[0].decode()] = [int(p) for p in parts[1:]]
+    return result
+
+def read_statm(pid: int) -> Dict[str, int]:
+    """Read /proc/<pid>/statm memory columns (values in pages)."""
+    with open(f'/proc/{pid}/statm', 'rb', buffering=0) as f:
+        size, resident, shared = f.read().split()[:3]
+    return {
+        'size': int(size),
+        'resident': int(resident),
+        'shared': int(shared)
+    }
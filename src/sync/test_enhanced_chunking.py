@@ -6,6 +6,17 @@ import os
 from typing import List, Dict, Any
 import json
 
+# orjson serializes dict-heavy results several times faster than stdlib json
+try:
+    import orjson
+
+    def _dump_results(results, f):
+        f.write(orjson.dumps(results, default=str,
+                             option=orjson.OPT_INDENT_2).decode())
+except ImportError:
+    def _dump_results(results, f):
+        json.dump(results, f, indent=2, default=str)
+
 from enhanced_text_splitter import (
     EnhancedTextSplitter, 
     ContentType, 
@@ -549,7 +560,7 @@ async def main():
     
     # Save results to file
     with open("chunking_test_results.json", "w") as f:
-        json.dump(results, f, indent=2, default=str)
+        _dump_results(results, f)
     
     # Print summary
     print("\n" + "="*50)
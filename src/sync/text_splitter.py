@@ -7,7 +7,7 @@ logger = logging.getLogger(__name__)
 
 # Import enhanced functionality
 try:
-    from .enhanced_text_splitter import EnhancedTextSplitter, semantic_split_enhanced
+    from .enhanced_text_splitter import get_default_splitter
     ENHANCED_AVAILABLE = True
 except ImportError:
     ENHANCED_AVAILABLE = False
@@ -41,8 +41,7 @@ async def semantic_split(text, max_chars=4000, overlap=200, file_path: str = "",
     # Try enhanced splitting first
     if use_enhanced and ENHANCED_AVAILABLE:
         try:
-            splitter = EnhancedTextSplitter()
-            result = await splitter.semantic_split_enhanced(text, file_path)
+            result = await get_default_splitter().semantic_split_enhanced(text, file_path)
             logger.info(f"Enhanced chunking: {result.chunk_count} chunks, "
                        f"quality score: {result.quality_score:.2f}, "
                        f"content type: {result.content_type.value}")
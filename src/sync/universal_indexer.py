@@ -84,36 +84,42 @@ class UniversalIndexer(AbstractIndexer):
         """Index a single file if it has changed."""
         try:
             logger.debug(f"Processing file: {file_path}")
-            
-            # Basic validation using base class method
-            if not self._validate_file_for_indexing(file_path):
+
+            # Validation stats and hashes on a worker thread; keeping it
+            # off the loop is what lets index_directory's gather actually
+            # overlap files
+            if not await asyncio.to_thread(self._validate_file_for_indexing,
+                                           file_path):
                 logger.debug(f"File validation failed, skipping: {file_path}")
                 return
-            
+
             logger.debug(f"File validation passed: {file_path}")
-            
+
             # Additional safety check for binary files
             if self._should_skip_file(file_path):
                 logger.debug(f"File should be skipped, storing metadata only: {file_path}")
                 metadata = self._get_file_metadata(file_path)
                 if self.metadata_enhancer:
                     metadata = self.metadata_enhancer(metadata, file_path)
-                if self._index_metadata_only(file_path, metadata):
+                if await asyncio.to_thread(self._index_metadata_only,
+                                           file_path, metadata):
                     self._update_file_hash(file_path)
                 return
-            
+
             # Get file metadata
             metadata = self._get_file_metadata(file_path)
             if self.metadata_enhancer:
                 metadata = self.metadata_enhancer(metadata, file_path)
-            
-            # Read content if appropriate
-            content = self._read_file_content(file_path)
-            
+
+            # File reads block too; same treatment as validation
+            content = await asyncio.to_thread(self._read_file_content,
+                                              file_path)
+
             if content is None:
                 logger.debug(f"No content to index, storing metadata only: {file_path}")
                 # Handle large files with metadata only
-                if self._index_metadata_only(file_path, metadata):
+                if await asyncio.to_thread(self._index_metadata_only,
+                                           file_path, metadata):
                     self._update_file_hash(file_path)
             else:
                 logger.debug(f"Content read successfully, processing chunks: {file_path}")
@@ -130,22 +136,59 @@ class UniversalIndexer(AbstractIndexer):
         except Exception as e:
             logger.error(f"Error indexing file {file_path}: {e}")
 
+    # Cap on concurrently indexed files; throughput scales with this
+    # until Marqo saturates
+    _DIRECTORY_CONCURRENCY = 32
+
+    def _collect_file_paths(self, directory: str) -> List[str]:
+        """Walk a tree iteratively with scandir and return file paths."""
+        paths: List[str] = []
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        if is_dir:
+                            if not self.config.should_skip_directory(entry.path):
+                                stack.append(entry.path)
+                        else:
+                            paths.append(entry.path)
+            except OSError as e:
+                logger.error(f"Error scanning directory {current}: {e}")
+        return paths
+
     async def index_directory(self, directory: str) -> None:
-        """Recursively index all files in a directory."""
+        """Recursively index all files in a directory concurrently."""
         logger.info(f"Starting initial indexing of directory: {directory}")
         try:
-            # Track existing files to detect deletions
-            current_files = set()
-            
-            for root, dirs, files in os.walk(directory):
-                # Skip directories that match skip patterns
-                dirs[:] = [d for d in dirs if not self.config.should_skip_directory(d)]
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    current_files.add(file_path)
+            # Scan on a worker thread, then fan out per-file indexing;
+            # the semaphore bounds in-flight files so Marqo sees steady
+            # parallelism instead of an unbounded burst
+            paths = await asyncio.to_thread(self._collect_file_paths, directory)
+            current_files = set(paths)
+
+            # Bulk pre-hash the new/changed candidates up front; per-file
+            # validation then consumes the digests instead of hashing one
+            # file at a time inside each task
+            to_hash = [p for p in paths if self._needs_rehash(p)]
+            if to_hash:
+                self._prehashed.update(
+                    await self._hash_files_bulk_async(to_hash))
+
+            sema = asyncio.Semaphore(self._DIRECTORY_CONCURRENCY)
+
+            async def _index_one(file_path: str) -> None:
+                async with sema:
                     await self.index_file(file_path)
-                    
+
+            await asyncio.gather(*(_index_one(p) for p in paths))
+
+
             # Remove hashes for deleted files
             deleted_files = set(self.file_hashes.keys()) - current_files
             for file_path in deleted_files:
@@ -154,7 +197,10 @@ class UniversalIndexer(AbstractIndexer):
             
             if deleted_files:
                 self._save_hashes()
-                
+
+            # Persist any hash updates still buffered in memory
+            await self.flush()
+
         except Exception as e:
             logger.error(f"Error during directory indexing: {e}")
 